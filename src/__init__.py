@@ -86,16 +86,16 @@ def __getattr__(name):
     # Streaming history
     _history_names = (
         "sync_all_export_data", "sync_streaming_history",
-        "load_streaming_history", "load_search_queries_cached",
-        "load_wrapped_data_cached", "load_follow_data_cached",
+        "load_streaming_history", "iter_streaming_history", "get_streaming_history_max_timestamp",
+        "load_search_queries_cached", "load_wrapped_data_cached", "load_follow_data_cached",
         "load_library_snapshot_cached", "load_playback_errors_cached",
         "load_playback_retries_cached", "load_webapi_events_cached",
     )
     if name in _history_names:
         from .analysis.streaming_history import (
             sync_all_export_data, sync_streaming_history,
-            load_streaming_history, load_search_queries_cached,
-            load_wrapped_data_cached, load_follow_data_cached,
+            load_streaming_history, iter_streaming_history, get_streaming_history_max_timestamp,
+            load_search_queries_cached, load_wrapped_data_cached, load_follow_data_cached,
             load_library_snapshot_cached, load_playback_errors_cached,
             load_playback_retries_cached, load_webapi_events_cached,
         )
@@ -137,6 +137,8 @@ __all__ = [
     "sync_all_export_data",
     "sync_streaming_history",
     "load_streaming_history",
+    "iter_streaming_history",
+    "get_streaming_history_max_timestamp",
     "load_search_queries_cached",
     "load_wrapped_data_cached",
     "load_follow_data_cached",
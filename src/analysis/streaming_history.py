@@ -9,7 +9,7 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterator, List
 import pandas as pd
 import numpy as np
 from datetime import datetime
@@ -389,6 +389,76 @@ def load_streaming_history(data_dir: Path) -> Optional[pd.DataFrame]:
     return pd.read_parquet(history_path)
 
 
+def iter_streaming_history(
+    data_dir: Path,
+    columns: Optional[List[str]] = None,
+    batch_size: int = 100_000,
+) -> Iterator[pd.DataFrame]:
+    """Yield streaming history in record batches instead of loading the whole file.
+
+    Only the requested ``columns`` that exist in the file are read, so peak memory
+    scales with ``batch_size`` rather than with the full history. Falls back to a
+    single full read when pyarrow is not available.
+    """
+    history_path = data_dir / "streaming_history.parquet"
+    if not history_path.exists():
+        return
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        df = pd.read_parquet(history_path)
+        if columns is not None:
+            df = df[[c for c in columns if c in df.columns]]
+        if not df.empty:
+            yield df
+        return
+    pf = pq.ParquetFile(history_path)
+    if columns is not None:
+        available = set(pf.schema_arrow.names)
+        columns = [c for c in columns if c in available]
+    for batch in pf.iter_batches(batch_size=batch_size, columns=columns):
+        if batch.num_rows:
+            yield batch.to_pandas()
+
+
+def get_streaming_history_max_timestamp(data_dir: Path) -> Optional[pd.Timestamp]:
+    """Latest streaming history timestamp, read from parquet row-group statistics.
+
+    Touches only file metadata, so the cost does not grow with the history size.
+    Returns None when pyarrow is unavailable, the column is not a timestamp, or any
+    row group lacks statistics; callers should then fall back to scanning the data.
+    """
+    history_path = data_dir / "streaming_history.parquet"
+    if not history_path.exists():
+        return None
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        return None
+    pf = pq.ParquetFile(history_path)
+    schema = pf.schema_arrow
+    if "timestamp" not in schema.names or not pa.types.is_timestamp(schema.field("timestamp").type):
+        return None
+    latest = None
+    metadata = pf.metadata
+    for i in range(metadata.num_row_groups):
+        row_group = metadata.row_group(i)
+        for j in range(row_group.num_columns):
+            column = row_group.column(j)
+            if column.path_in_schema != "timestamp":
+                continue
+            stats = column.statistics
+            if stats is None or not stats.has_min_max:
+                return None
+            value = pd.Timestamp(stats.max)
+            if latest is None or value > latest:
+                latest = value
+    if latest is not None and schema.field("timestamp").type.tz and latest.tzinfo is None:
+        latest = latest.tz_localize("UTC")
+    return latest
+
+
 def load_search_queries_cached(data_dir: Path) -> Optional[pd.DataFrame]:
     """Load search queries from parquet file."""
     path = data_dir / "search_queries.parquet"
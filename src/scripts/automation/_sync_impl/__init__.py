@@ -36,13 +36,15 @@ from .settings import (
     MOOD_MAX_TAGS,
     DEFAULT_DISCOVERY_TRACK_LIMIT,
 )
-from .logger import log, verbose_log, log_step_banner, timed_step, set_verbose, get_log_buffer
+from .logger import log, verbose_log, log_step_banner, timed_step, set_verbose, get_log_buffer, set_log_buffering
 from .api import api_call, get_spotify_client, _chunked
 from .catalog import (
     get_existing_playlists,
     get_playlist_tracks,
     get_liked_song_uris,
+    get_playlist_snapshots,
     get_user_info,
+    evict_playlist_tracks,
     _invalidate_playlist_cache,
     _load_genre_data,
     _playlist_cache,
@@ -50,6 +52,7 @@ from .catalog import (
 )
 from .tracks import (
     _to_uri,
+    _to_uri_series,
     _uri_to_track_id,
     _get_preview_urls_for_tracks,
     _get_audio_features_for_tracks,
@@ -57,14 +60,15 @@ from .tracks import (
     _get_all_track_genres,
     _get_primary_artist_genres,
 )
-from .descriptions import _update_playlist_description_with_genres
-from .workflow import sync_full_library, sync_export_data
+from .descriptions import _update_playlist_description_with_genres, _update_all_playlist_descriptions
+from .workflow import sync_full_library, sync_export_data, _SYNC_STATE
 from .renames import rename_playlists_with_old_prefixes
 from .history import (
     get_most_played_tracks,
     get_time_based_tracks,
     get_repeat_tracks,
     get_discovery_tracks,
+    get_top_and_discovery_tracks,
 )
 
 __all__ = [
@@ -103,18 +107,22 @@ __all__ = [
     "timed_step",
     "set_verbose",
     "get_log_buffer",
+    "set_log_buffering",
     "api_call",
     "get_spotify_client",
     "_chunked",
     "get_existing_playlists",
     "get_playlist_tracks",
     "get_liked_song_uris",
+    "get_playlist_snapshots",
     "get_user_info",
+    "evict_playlist_tracks",
     "_invalidate_playlist_cache",
     "_load_genre_data",
     "_playlist_cache",
     "_playlist_tracks_cache",
     "_to_uri",
+    "_to_uri_series",
     "_uri_to_track_id",
     "_get_preview_urls_for_tracks",
     "_get_audio_features_for_tracks",
@@ -122,11 +130,14 @@ __all__ = [
     "_get_all_track_genres",
     "_get_primary_artist_genres",
     "_update_playlist_description_with_genres",
+    "_update_all_playlist_descriptions",
     "sync_full_library",
+    "_SYNC_STATE",
     "sync_export_data",
     "rename_playlists_with_old_prefixes",
     "get_most_played_tracks",
     "get_time_based_tracks",
     "get_repeat_tracks",
     "get_discovery_tracks",
+    "get_top_and_discovery_tracks",
 ]
@@ -8,8 +8,11 @@ from typing import Callable, Any
 import os
 from pathlib import Path
 
+import requests
 import spotipy
+from requests.adapters import HTTPAdapter
 from spotipy.oauth2 import SpotifyOAuth
+from urllib3.util.retry import Retry
 
 from src.scripts.common.api_wrapper import api_call as standard_api_call
 from src.scripts.common.api_helpers import chunked as chunked_helper
@@ -17,6 +20,29 @@ from src.scripts.common.api_helpers import chunked as chunked_helper
 from . import settings
 from . import logger
 
+# Connections kept open to api.spotify.com; sized for the worker pools that share the client
+HTTP_POOL_SIZE = 16
+
+
+def _build_http_session() -> requests.Session:
+    """One pooled keep-alive session for the whole run, with the same retry policy spotipy
+    would mount on its own session (429/5xx, honouring Retry-After)."""
+    retry = Retry(
+        total=3,
+        connect=None,
+        read=False,
+        allowed_methods=frozenset(["GET", "POST", "PUT", "DELETE"]),
+        status=3,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=HTTP_POOL_SIZE, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
 
 def api_call(
     fn: Callable,
@@ -75,7 +101,7 @@ def get_spotify_client() -> spotipy.Spotify:
         )
         token_info = auth.refresh_access_token(refresh_token)
         auth.cache_handler.save_token_to_cache(token_info)
-        return spotipy.Spotify(auth_manager=auth)
+        return spotipy.Spotify(auth_manager=auth, requests_session=_build_http_session())
     else:
         auth = SpotifyOAuth(
             client_id=client_id,
@@ -84,7 +110,7 @@ def get_spotify_client() -> spotipy.Spotify:
             scope=scopes,
             cache_path=cache_path,
         )
-        return spotipy.Spotify(auth_manager=auth)
+        return spotipy.Spotify(auth_manager=auth, requests_session=_build_http_session())
 
 
 # Backward compatibility: _chunked used by playlist_update, data_protection, etc.
@@ -4,6 +4,8 @@ Sync catalog: playlists, playlist tracks, user info.
 In-memory caches for the duration of a run; invalidate after modifying playlists.
 """
 
+import threading
+
 import pandas as pd
 import spotipy
 
@@ -17,16 +19,25 @@ _playlist_cache_valid = False
 _playlist_tracks_cache = {}
 _user_cache = None
 _genre_data_cache = None
+# Guards _playlist_tracks_cache (read/written from playlist-update worker threads)
+_playlist_tracks_lock = threading.Lock()
 
 
 def _invalidate_playlist_cache():
     """Invalidate playlist and playlist tracks cache (call after modifying playlists)."""
     global _playlist_cache, _playlist_tracks_cache, _playlist_cache_valid
     _playlist_cache = None
-    _playlist_tracks_cache = {}
+    with _playlist_tracks_lock:
+        _playlist_tracks_cache = {}
     _playlist_cache_valid = False
 
 
+def evict_playlist_tracks(playlist_id: str) -> None:
+    """Forget the cached tracks of one playlist (call after adding/removing its tracks)."""
+    with _playlist_tracks_lock:
+        _playlist_tracks_cache.pop(playlist_id, None)
+
+
 def get_existing_playlists(sp: spotipy.Spotify, force_refresh: bool = False) -> dict:
     """
     Get all user playlists as {name: id}.
@@ -69,18 +80,39 @@ def get_existing_playlists(sp: spotipy.Spotify, force_refresh: bool = False) ->
     return mapping
 
 
-def get_playlist_tracks(sp: spotipy.Spotify, playlist_id: str, force_refresh: bool = False) -> set:
+def get_playlist_snapshots(sp: spotipy.Spotify) -> dict:
     """
-    Get all track URIs in a playlist.
-    Cached in-memory; invalidated for a playlist when tracks are added.
+    Get current snapshot_id for every user playlist as {id: snapshot_id}.
+    Always fetched live (one request per page of playlists), since adding tracks changes snapshots.
     """
-    global _playlist_tracks_cache
-
-    if playlist_id in _playlist_tracks_cache and not force_refresh:
-        logger.verbose_log(
-            f"Using cached tracks for playlist {playlist_id} ({len(_playlist_tracks_cache[playlist_id])} tracks)"
+    snapshots = {}
+    offset = 0
+    while True:
+        page = api.api_call(
+            sp.current_user_playlists,
+            limit=settings.SPOTIFY_API_PAGINATION_LIMIT,
+            offset=offset,
         )
-        return _playlist_tracks_cache[playlist_id]
+        for item in page.get("items", []):
+            if item.get("snapshot_id"):
+                snapshots[item["id"]] = item["snapshot_id"]
+        if not page.get("next"):
+            break
+        offset += settings.SPOTIFY_API_PAGINATION_LIMIT
+    return snapshots
+
+
+def get_playlist_tracks(sp: spotipy.Spotify, playlist_id: str, force_refresh: bool = False) -> frozenset:
+    """
+    Get all track URIs in a playlist as a frozenset (callers can test membership directly).
+    Cached in-memory; invalidated for a playlist when tracks are added.
+    """
+    if not force_refresh:
+        with _playlist_tracks_lock:
+            cached = _playlist_tracks_cache.get(playlist_id)
+        if cached is not None:
+            logger.verbose_log(f"Using cached tracks for playlist {playlist_id} ({len(cached)} tracks)")
+            return cached
 
     logger.verbose_log(f"Fetching tracks for playlist {playlist_id} from API (force_refresh={force_refresh})...")
     uris = set()
@@ -100,8 +132,10 @@ def get_playlist_tracks(sp: spotipy.Spotify, playlist_id: str, force_refresh: bo
             break
         offset += 100
 
-    _playlist_tracks_cache[playlist_id] = uris
-    return uris
+    tracks = frozenset(uris)
+    with _playlist_tracks_lock:
+        _playlist_tracks_cache[playlist_id] = tracks
+    return tracks
 
 
 def get_liked_song_uris(sp: spotipy.Spotify) -> list:
@@ -5,6 +5,9 @@ Updates incrementally: skip playlists whose snapshot_id has not changed.
 """
 
 import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 import spotipy
@@ -16,6 +19,12 @@ from . import catalog
 
 _CACHE_FILENAME = ".description_snapshot_cache.json"
 
+# Concurrent description updates; kept low to stay clear of Spotify's rate limit
+DESCRIPTION_UPDATE_WORKERS = 4
+
+# Serializes read-modify-write of the snapshot cache file across worker threads
+_snapshot_cache_lock = threading.Lock()
+
 
 def _load_snapshot_cache() -> dict:
     path = settings.get_sync_data_dir() / _CACHE_FILENAME
@@ -30,13 +39,22 @@ def _load_snapshot_cache() -> dict:
 
 def _save_snapshot_cache(cache: dict) -> None:
     path = settings.get_sync_data_dir() / _CACHE_FILENAME
+    tmp_path = path.with_name(path.name + ".tmp")
     try:
-        with open(path, "w", encoding="utf-8") as f:
+        with open(tmp_path, "w", encoding="utf-8") as f:
             json.dump(cache, f, indent=0)
+        os.replace(tmp_path, path)
     except Exception as e:
         logger.verbose_log(f"  Could not save description cache: {e}")
 
 
+def _remember_snapshot(playlist_id: str, snapshot_id: str) -> None:
+    with _snapshot_cache_lock:
+        cache = _load_snapshot_cache()
+        cache[playlist_id] = snapshot_id
+        _save_snapshot_cache(cache)
+
+
 def _update_playlist_description_with_genres(
     sp: spotipy.Spotify, user_id: str, playlist_id: str, track_uris: list = None
 ) -> bool:
@@ -108,9 +126,7 @@ def _update_playlist_description_with_genres(
                 )
                 logger.verbose_log(f"  ✅ Updated description for playlist '{playlist_name}' ({len(new_description)} chars)")
                 if snapshot_id:
-                    cache = _load_snapshot_cache()
-                    cache[playlist_id] = snapshot_id
-                    _save_snapshot_cache(cache)
+                    _remember_snapshot(playlist_id, snapshot_id)
                 return True
             except UnicodeEncodeError as e:
                 logger.verbose_log(f"  ⚠️  Invalid encoding in description for '{playlist_name}': {e}")
@@ -133,10 +149,45 @@ def _update_playlist_description_with_genres(
                 logger.verbose_log(f"  Description repr (first 200): {repr(new_description[:200])}")
                 return False
         if snapshot_id:
-            cache = _load_snapshot_cache()
-            cache[playlist_id] = snapshot_id
-            _save_snapshot_cache(cache)
+            _remember_snapshot(playlist_id, snapshot_id)
         return False
     except Exception as e:
         logger.verbose_log(f"  Failed to update description: {e}")
         return False
+
+
+def _update_all_playlist_descriptions(
+    sp: spotipy.Spotify,
+    user_id: str,
+    playlist_ids: list,
+    snapshots: dict = None,
+    max_workers: int = DESCRIPTION_UPDATE_WORKERS,
+) -> int:
+    """Update descriptions for many playlists concurrently; returns how many were changed.
+    Each update is a few blocking API round-trips, so a small thread pool overlaps them;
+    api_call still backs off on 429 responses.
+    snapshots ({id: snapshot_id}, e.g. from catalog.get_playlist_snapshots) lets playlists
+    unchanged since their last description pass be skipped without any per-playlist request."""
+    playlist_ids = [pid for pid in playlist_ids if pid]
+    if snapshots:
+        cache = _load_snapshot_cache()
+        changed = [pid for pid in playlist_ids if not snapshots.get(pid) or cache.get(pid) != snapshots[pid]]
+        logger.verbose_log(f"  {len(playlist_ids) - len(changed)} playlist(s) unchanged since last description pass")
+        playlist_ids = changed
+    if not playlist_ids:
+        return 0
+    updated = 0
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(playlist_ids)))) as executor:
+        futures = {
+            executor.submit(_update_playlist_description_with_genres, sp, user_id, pid, None): pid
+            for pid in playlist_ids
+        }
+        for done, future in enumerate(as_completed(futures), 1):
+            pid = futures[future]
+            try:
+                if future.result():
+                    updated += 1
+            except Exception as e:
+                logger.verbose_log(f"  Description update failed for playlist_id={pid}: {e}")
+            logger.verbose_log(f"  Description update {done}/{len(playlist_ids)}: playlist_id={pid}")
+    return updated
@@ -195,3 +195,51 @@ def get_discovery_tracks(
         )
         sorted_new_tracks = first_plays[track_col].tolist()
         return sorted_new_tracks[:limit]
+
+
+def get_top_and_discovery_tracks(
+    history_df: pd.DataFrame,
+    month_str: str = None,
+    limit: int = 100,
+) -> tuple:
+    """Get most played and newly discovered tracks from a single groupby.
+
+    Returns (top_uris, discovery_uris) with the same ordering as
+    get_most_played_tracks and get_discovery_tracks.
+    """
+    if history_df is None or history_df.empty:
+        return [], []
+
+    if "track_uri" in history_df.columns:
+        track_col = "track_uri"
+    elif "spotify_track_uri" in history_df.columns:
+        track_col = "spotify_track_uri"
+    else:
+        return [], []
+
+    known_tracks = set()
+    if month_str:
+        months = history_df["timestamp"].dt.to_period("M").astype(str)
+        month_data = history_df[months == month_str]
+        known_tracks = set(history_df.loc[months < month_str, track_col].dropna().unique())
+    else:
+        month_data = history_df
+
+    if month_data.empty:
+        return [], []
+
+    track_stats = month_data.groupby(track_col).agg(
+        play_count=("ms_played", "count"),
+        total_ms=("ms_played", "sum"),
+        first_play=("timestamp", "min"),
+    )
+    track_stats = track_stats[track_stats.index.notna() & (track_stats.index != "")]
+
+    top_stats = track_stats.sort_values(["play_count", "total_ms"], ascending=False)
+    top_tracks = top_stats.index[:limit].tolist()
+
+    if known_tracks:
+        track_stats = track_stats[~track_stats.index.isin(known_tracks)]
+    discovery_stats = track_stats.sort_values("first_play", kind="stable")
+    discovery_tracks = discovery_stats.index[:limit].tolist()
+    return top_tracks, discovery_tracks
@@ -5,6 +5,7 @@ Buffers log lines for email notification when enabled.
 """
 
 import time
+from collections import deque
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
@@ -14,8 +15,10 @@ try:
 except ImportError:
     tqdm = None
 
+# Lines kept for the email body; older lines are dropped so long runs stay bounded
+LOG_BUFFER_MAX_LINES = 10_000
 # Global log buffer for email notifications
-_log_buffer = []
+_log_buffer = deque(maxlen=LOG_BUFFER_MAX_LINES)
 # Global verbose flag (set by CLI)
 _verbose = False
 # Cached email-enabled check (None = not yet checked)
@@ -33,11 +36,17 @@ def get_verbose() -> bool:
     return _verbose
 
 
-def get_log_buffer() -> list:
-    """Return the in-memory log buffer (for email)."""
+def get_log_buffer() -> deque:
+    """Return the in-memory log buffer (for email); holds the last LOG_BUFFER_MAX_LINES lines."""
     return _log_buffer
 
 
+def set_log_buffering(enabled: bool) -> None:
+    """Set whether log() buffers lines for the email (skips the lazy email_notify probe)."""
+    global _email_enabled_cache
+    _email_enabled_cache = bool(enabled)
+
+
 def _is_email_enabled() -> bool:
     """Cached check: email available and enabled. Only evaluates once per process."""
     global _email_enabled_cache
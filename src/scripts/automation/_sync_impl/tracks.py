@@ -21,6 +21,13 @@ def _to_uri(track_id: str) -> str:
     return track_id
 
 
+def _to_uri_series(track_ids):
+    """Vectorized _to_uri over a pandas Series (missing ids stay missing)."""
+    ids = track_ids.astype("string")
+    bare = (ids.str.len() >= settings.MIN_TRACK_ID_LENGTH) & ~ids.str.contains(":", regex=False)
+    return ("spotify:track:" + ids).where(bare.fillna(False), ids).astype(object)
+
+
 def _uri_to_track_id(track_uri: str) -> str:
     """Extract track ID from track URI."""
     if track_uri.startswith("spotify:track:"):
@@ -14,6 +14,10 @@ from src.scripts.common.config_helpers import parse_bool_env
 from .logger import log, verbose_log, timed_step
 from .settings import DATA_DIR
 
+# In-memory handoff from the sync step to later steps in the same run
+# ("playlists_df": the playlists table sync_full_library just loaded)
+_SYNC_STATE = {}
+
 
 @handle_errors(reraise=True, log_error=True)
 def sync_full_library(force: bool = False) -> bool:
@@ -59,7 +63,7 @@ def sync_full_library(force: bool = False) -> bool:
             )
 
         with timed_step("Load All Playlists"):
-            _ = sf.playlists(force=force)
+            _SYNC_STATE["playlists_df"] = sf.playlists(force=force)
 
         log(f"✅ Library sync complete: {stats}")
 
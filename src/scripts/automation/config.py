@@ -22,7 +22,8 @@ from src.scripts.common.config_helpers import (
     parse_str_env,
     parse_list_env,
     get_env_or_none,
-    require_env
+    require_env,
+    snapshot_env,
 )
 
 # Alias for backward compatibility
@@ -163,6 +164,30 @@ PARALLEL_MIN_TRACKS = 50  # Minimum tracks to enable parallel processing
 PARALLEL_DEFAULT_WORKERS = None  # None = auto-detect (CPU count)
 PARALLEL_MAX_WORKERS = 8  # Maximum number of parallel workers
 
+# ============================================================================
+# STARTUP VALIDATION
+# ============================================================================
+
+# Checked together by sync.main() before any step runs (see validate_config), so every
+# missing or malformed value is reported at once instead of failing mid-run
+STARTUP_CONFIG_SCHEMA = {
+    "SPOTIPY_CLIENT_ID": {"type": str, "required": True},
+    "SPOTIPY_CLIENT_SECRET": {"type": str, "required": True},
+    "SPOTIPY_REDIRECT_URI": {"type": str, "default": "http://127.0.0.1:8888/callback"},
+    "SPOTIM8_DATA_DIR": {"type": "path"},
+    "DATA_DIR": {"type": "path"},
+    "KEEP_MONTHLY_MONTHS": {"type": int, "default": 3},
+    "MOOD_MAX_TAGS": {"type": int, "default": 5},
+    "PLAYLIST_ENABLE_MONTHLY": {"type": bool, "default": True},
+    "PLAYLIST_ENABLE_MOST_PLAYED": {"type": bool, "default": True},
+    "PLAYLIST_ENABLE_DISCOVERY": {"type": bool, "default": True},
+    "ENABLE_MOOD_TAGS": {"type": bool, "default": False},
+    "ENABLE_HEALTH_CHECK": {"type": bool, "default": False},
+    "ENABLE_INSIGHTS_REPORT": {"type": bool, "default": False},
+    "SYNC_OWNED_ONLY": {"type": bool, "default": True},
+    "SYNC_INCLUDE_LIKED_SONGS": {"type": bool, "default": True},
+}
+
 # ============================================================================
 # MONTH NAME MAPPINGS
 # ============================================================================
@@ -188,27 +213,29 @@ def reload_from_env() -> None:
     global DATE_FORMAT, SEPARATOR_MONTH, SEPARATOR_PREFIX, CAPITALIZATION
     global KEEP_MONTHLY_MONTHS, DESCRIPTION_TEMPLATE, ENABLE_MOOD_TAGS, MOOD_MAX_TAGS
     DATA_DIR = _get_data_dir(__file__)
-    OWNER_NAME = parse_str_env("PLAYLIST_OWNER_NAME", "AJ")
-    BASE_PREFIX = parse_str_env("PLAYLIST_PREFIX", "Finds")
-    ENABLE_MONTHLY = parse_bool_env("PLAYLIST_ENABLE_MONTHLY", True)
-    ENABLE_MOST_PLAYED = parse_bool_env("PLAYLIST_ENABLE_MOST_PLAYED", True)
-    ENABLE_DISCOVERY = parse_bool_env("PLAYLIST_ENABLE_DISCOVERY", True)
-    PREFIX_MONTHLY = parse_str_env("PLAYLIST_PREFIX_MONTHLY", BASE_PREFIX)
-    PREFIX_YEARLY = parse_str_env("PLAYLIST_PREFIX_YEARLY", BASE_PREFIX)
-    PREFIX_MOST_PLAYED = parse_str_env("PLAYLIST_PREFIX_MOST_PLAYED", "Top")
-    PREFIX_DISCOVERY = parse_str_env("PLAYLIST_PREFIX_DISCOVERY", "Discovery")
-    MONTHLY_NAME_TEMPLATE = parse_str_env("PLAYLIST_TEMPLATE_MONTHLY", "{owner}{prefix}{mon}{year}")
-    YEARLY_NAME_TEMPLATE = parse_str_env("PLAYLIST_TEMPLATE_YEARLY", "{owner}{prefix}{year}")
-    MOST_PLAYED_TEMPLATE = parse_str_env("PLAYLIST_TEMPLATE_MOST_PLAYED", "{owner}{prefix}{mon}{year}")
-    DISCOVERY_TEMPLATE = parse_str_env("PLAYLIST_TEMPLATE_DISCOVERY", "{owner}{prefix}{mon}{year}")
-    DATE_FORMAT = parse_str_env("PLAYLIST_DATE_FORMAT", "short")
-    SEPARATOR_MONTH = parse_str_env("PLAYLIST_SEPARATOR_MONTH", "none")
-    SEPARATOR_PREFIX = parse_str_env("PLAYLIST_SEPARATOR_PREFIX", "none")
-    CAPITALIZATION = parse_str_env("PLAYLIST_CAPITALIZATION", "preserve")
-    KEEP_MONTHLY_MONTHS = parse_int_env("KEEP_MONTHLY_MONTHS", 3)
-    DESCRIPTION_TEMPLATE = parse_str_env("PLAYLIST_DESCRIPTION_TEMPLATE", "{description} from {period}")
-    ENABLE_MOOD_TAGS = parse_bool_env("ENABLE_MOOD_TAGS", False)
-    MOOD_MAX_TAGS = parse_int_env("MOOD_MAX_TAGS", 5)
+    # One copy of the environment for all reads below
+    env = snapshot_env()
+    OWNER_NAME = parse_str_env("PLAYLIST_OWNER_NAME", "AJ", env=env)
+    BASE_PREFIX = parse_str_env("PLAYLIST_PREFIX", "Finds", env=env)
+    ENABLE_MONTHLY = parse_bool_env("PLAYLIST_ENABLE_MONTHLY", True, env=env)
+    ENABLE_MOST_PLAYED = parse_bool_env("PLAYLIST_ENABLE_MOST_PLAYED", True, env=env)
+    ENABLE_DISCOVERY = parse_bool_env("PLAYLIST_ENABLE_DISCOVERY", True, env=env)
+    PREFIX_MONTHLY = parse_str_env("PLAYLIST_PREFIX_MONTHLY", BASE_PREFIX, env=env)
+    PREFIX_YEARLY = parse_str_env("PLAYLIST_PREFIX_YEARLY", BASE_PREFIX, env=env)
+    PREFIX_MOST_PLAYED = parse_str_env("PLAYLIST_PREFIX_MOST_PLAYED", "Top", env=env)
+    PREFIX_DISCOVERY = parse_str_env("PLAYLIST_PREFIX_DISCOVERY", "Discovery", env=env)
+    MONTHLY_NAME_TEMPLATE = parse_str_env("PLAYLIST_TEMPLATE_MONTHLY", "{owner}{prefix}{mon}{year}", env=env)
+    YEARLY_NAME_TEMPLATE = parse_str_env("PLAYLIST_TEMPLATE_YEARLY", "{owner}{prefix}{year}", env=env)
+    MOST_PLAYED_TEMPLATE = parse_str_env("PLAYLIST_TEMPLATE_MOST_PLAYED", "{owner}{prefix}{mon}{year}", env=env)
+    DISCOVERY_TEMPLATE = parse_str_env("PLAYLIST_TEMPLATE_DISCOVERY", "{owner}{prefix}{mon}{year}", env=env)
+    DATE_FORMAT = parse_str_env("PLAYLIST_DATE_FORMAT", "short", env=env)
+    SEPARATOR_MONTH = parse_str_env("PLAYLIST_SEPARATOR_MONTH", "none", env=env)
+    SEPARATOR_PREFIX = parse_str_env("PLAYLIST_SEPARATOR_PREFIX", "none", env=env)
+    CAPITALIZATION = parse_str_env("PLAYLIST_CAPITALIZATION", "preserve", env=env)
+    KEEP_MONTHLY_MONTHS = parse_int_env("KEEP_MONTHLY_MONTHS", 3, env=env)
+    DESCRIPTION_TEMPLATE = parse_str_env("PLAYLIST_DESCRIPTION_TEMPLATE", "{description} from {period}", env=env)
+    ENABLE_MOOD_TAGS = parse_bool_env("ENABLE_MOOD_TAGS", False, env=env)
+    MOOD_MAX_TAGS = parse_int_env("MOOD_MAX_TAGS", 5, env=env)
     # Update _sync_impl.settings so it sees new values
     try:
         from src.scripts.automation import _sync_impl
@@ -204,7 +204,7 @@ def safe_remove_tracks_from_playlist(
     Returns:
         Tuple of (success, backup_file_path)
     """
-    from .sync import api_call, log, get_playlist_tracks, _chunked, _playlist_tracks_cache
+    from .sync import api_call, log, get_playlist_tracks, _chunked, evict_playlist_tracks
     backup_file = None
 
     try:
@@ -221,8 +221,7 @@ def safe_remove_tracks_from_playlist(
                 api_call(sp.playlist_remove_all_occurrences_of_items, playlist_id, chunk)
 
             # Invalidate cache
-            if playlist_id in _playlist_tracks_cache:
-                del _playlist_tracks_cache[playlist_id]
+            evict_playlist_tracks(playlist_id)
 
         # Validate after removal
         if validate_after:
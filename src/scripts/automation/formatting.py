@@ -7,9 +7,21 @@ Note: All config values are accessed via the config module at call time (not imp
 so that reload_from_env() is respected.
 """
 
+from functools import lru_cache
+
 from . import config as _config
 
 
+def _config_key() -> tuple:
+    """Config values the formatters read; part of every cache key so reload_from_env() is respected."""
+    return (
+        _config.OWNER_NAME, _config.BASE_PREFIX, _config.PREFIX_MONTHLY, _config.PREFIX_YEARLY,
+        _config.PREFIX_MOST_PLAYED, _config.PREFIX_DISCOVERY, _config.YEARLY_NAME_TEMPLATE,
+        _config.DATE_FORMAT, _config.SEPARATOR_MONTH, _config.SEPARATOR_PREFIX,
+        _config.CAPITALIZATION, _config.DESCRIPTION_TEMPLATE,
+    )
+
+
 def _get_separator(sep_type: str) -> str:
     """Get separator character based on type."""
     sep_map = {
@@ -101,6 +113,19 @@ def format_playlist_name(
     Returns:
         Formatted playlist name
     """
+    return _format_playlist_name(_config_key(), template, month_str, genre, prefix, playlist_type, year)
+
+
+@lru_cache(maxsize=512)
+def _format_playlist_name(
+    config_key: tuple,
+    template: str,
+    month_str: str,
+    genre: str,
+    prefix: str,
+    playlist_type: str,
+    year: str
+) -> str:
     # Determine prefix based on playlist type if not provided (genre support removed)
     if prefix is None:
         prefix_map = {
@@ -207,6 +232,18 @@ def format_playlist_description(
     Returns:
         Formatted description string
     """
+    return _format_playlist_description(_config_key(), description, period, date, playlist_type, genre)
+
+
+@lru_cache(maxsize=512)
+def _format_playlist_description(
+    config_key: tuple,
+    description: str,
+    period: str,
+    date: str,
+    playlist_type: str,
+    genre: str
+) -> str:
     return _config.DESCRIPTION_TEMPLATE.format(
         description=description or "",
         period=period or "",
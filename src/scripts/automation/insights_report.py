@@ -27,9 +27,11 @@ import pandas as pd
 from src.scripts.automation.config import DATA_DIR
 from src.scripts.automation.playlist_intelligence import (
     generate_listening_insights_report,
+    compact_streaming_history,
     find_similar_playlists,
     suggest_playlist_merge_candidates,
-    calculate_playlist_health_score
+    calculate_playlist_health_score,
+    index_tracks_by_id
 )
 
 
@@ -71,7 +73,7 @@ def main():
     
     streaming_history_df = None
     if streaming_history_path.exists():
-        streaming_history_df = pd.read_parquet(streaming_history_path)
+        streaming_history_df = compact_streaming_history(pd.read_parquet(streaming_history_path))
     
     # Generate report
     report = generate_listening_insights_report(
@@ -89,12 +91,14 @@ def main():
         
         owned_playlists = playlists_df[playlists_df.get("is_owned", False) == True]
         
+        tracks_indexed = index_tracks_by_id(tracks_df)
         health_scores = []
         for _, playlist in owned_playlists.head(20).iterrows():  # Top 20
             score_data = calculate_playlist_health_score(
                 playlist["playlist_id"],
                 playlist_tracks_df,
-                tracks_df
+                tracks_df,
+                tracks_indexed=tracks_indexed
             )
             health_scores.append({
                 "name": playlist["name"],
@@ -9,13 +9,17 @@ utilities from sync.py to avoid circular dependencies.
 """
 
 import os
+import re
 import spotipy
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 import pandas as pd
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
 
 from .formatting import format_playlist_name, format_yearly_playlist_name, format_playlist_description
 from .error_handling import handle_errors
+from .config import PARALLEL_MAX_WORKERS
 
 @handle_errors(reraise=False, default_return=None, log_error=True)
 def consolidate_old_monthly_playlists(sp: spotipy.Spotify, keep_last_n_months: int = 3) -> None:
@@ -51,9 +55,8 @@ def consolidate_old_monthly_playlists(sp: spotipy.Spotify, keep_last_n_months: i
         ENABLE_MONTHLY, ENABLE_MOST_PLAYED, ENABLE_DISCOVERY,
         LIKED_SONGS_PLAYLIST_ID, YEARLY_NAME_TEMPLATE,
         get_existing_playlists, get_user_info, get_playlist_tracks,
-        get_most_played_tracks, get_discovery_tracks,
         api_call,
-        _chunked, _to_uri, _update_playlist_description_with_genres, _invalidate_playlist_cache,
+        _chunked, _to_uri_series, _update_playlist_description_with_genres, _invalidate_playlist_cache,
     )
     log("\n--- Ensure yearly archive playlists ---")
     
@@ -87,45 +90,32 @@ def consolidate_old_monthly_playlists(sp: spotipy.Spotify, keep_last_n_months: i
     
     monthly_playlists = {}  # {year: {type: [(name, id), ...]}}
     
-    for playlist_name, playlist_id in existing.items():
-        # Check each playlist type
-        for playlist_type, prefix in playlist_types.items():
-            monthly_pattern = f"{OWNER_NAME}{prefix}"
-            if playlist_name.startswith(monthly_pattern):
-                # Check if it matches monthly format (has a month name)
-                for mon_abbr in MONTH_NAMES.values():
-                    if playlist_name.startswith(f"{monthly_pattern}{mon_abbr}"):
-                        # Extract year (2 or 4 digits at the end)
-                        remaining = playlist_name[len(f"{monthly_pattern}{mon_abbr}"):]
-                        if remaining.isdigit():
-                            year_str = remaining
-                            # Convert 2-digit year to 4-digit (assume 2000s)
-                            if len(year_str) == 2:
-                                year = 2000 + int(year_str)
-                            else:
-                                year = int(year_str)
-                            
-                            # Find the month number from abbreviation
-                            month_num = None
-                            for num, abbr in MONTH_NAMES.items():
-                                if abbr == mon_abbr:
-                                    month_num = num
-                                    break
-                            
-                            if month_num:
-                                # Create YYYY-MM format string
-                                month_str = f"{year}-{month_num}"
-                                
-                                # Check if this month is at or before cutoff (should be consolidated)
-                                # Use <= to include the cutoff month itself
-                                if month_str <= cutoff_year_month:
-                                    if year not in monthly_playlists:
-                                        monthly_playlists[year] = {}
-                                    if playlist_type not in monthly_playlists[year]:
-                                        monthly_playlists[year][playlist_type] = []
-                                    monthly_playlists[year][playlist_type].append((playlist_name, playlist_id))
-                        break
-                break  # Found matching type, no need to check others
+    # Map each prefix back to its playlist type (first enabled type wins on shared prefixes)
+    prefix_types = {}
+    for playlist_type, prefix in playlist_types.items():
+        prefix_types.setdefault(prefix, playlist_type)
+    month_nums = {abbr: num for num, abbr in MONTH_NAMES.items()}
+    
+    if prefix_types:
+        monthly_re = _automated_monthly_re(OWNER_NAME, tuple(prefix_types), tuple(month_nums))
+        # Only playlists carrying the owner prefix can match, so bucket those once
+        for playlist_name, playlist_id in _owned_playlists(existing, OWNER_NAME):
+            match = monthly_re.fullmatch(playlist_name)
+            if not match:
+                continue
+            playlist_type = prefix_types[match.group("prefix")]
+            year_str = match.group("year")
+            # Convert 2-digit year to 4-digit (assume 2000s)
+            year = 2000 + int(year_str) if len(year_str) == 2 else int(year_str)
+            # Create YYYY-MM format string
+            month_str = f"{year}-{month_nums[match.group('mon')]}"
+            
+            # Check if this month is at or before cutoff (should be consolidated)
+            # Use <= to include the cutoff month itself
+            if month_str <= cutoff_year_month:
+                monthly_playlists.setdefault(year, {}).setdefault(playlist_type, []).append(
+                    (playlist_name, playlist_id)
+                )
     
     # Load liked songs data to get tracks by year (for "Finds" playlists)
     year_to_tracks = {}
@@ -137,39 +127,38 @@ def consolidate_old_monthly_playlists(sp: spotipy.Spotify, keep_last_n_months: i
             
             if not liked.empty:
                 # Parse timestamps
-                added_col = None
-                for col in ["added_at", "playlist_added_at", "track_added_at"]:
-                    if col in liked.columns:
-                        added_col = col
-                        break
+                columns = set(liked.columns)
+                added_col = next(
+                    (col for col in ("added_at", "playlist_added_at", "track_added_at") if col in columns),
+                    None
+                )
                 
                 if added_col:
                     liked[added_col] = pd.to_datetime(liked[added_col], errors="coerce", utc=True)
                     liked["year"] = liked[added_col].dt.year
                     
                     # Handle both track_uri and track_id columns
-                    if "track_uri" in liked.columns:
+                    if "track_uri" in columns:
                         liked["_uri"] = liked["track_uri"]
                     else:
-                        liked["_uri"] = liked["track_id"].map(_to_uri)
+                        liked["_uri"] = _to_uri_series(liked["track_id"])
+                    # Keep only non-empty string URIs (non-strings give NaN lengths) so the
+                    # playlist add paths below need no per-track validation
+                    liked = liked[liked["_uri"].str.len() > 0]
                     
                     # Build year -> tracks mapping (only for months at or before cutoff)
+                    # Months arrive in order, so one seen-set per year dedups at insertion time
                     liked["year_month"] = liked[added_col].dt.to_period("M").astype(str)
+                    year_seen = {}  # {year: (uris, seen)}
                     for year_month, group in liked.groupby("year_month"):
                         if year_month <= cutoff_year_month:
                             year = int(year_month.split("-")[0])
-                            uris = group["_uri"].dropna().tolist()
-                            # Deduplicate while preserving order
-                            seen = set()
-                            unique = [u for u in uris if not (u in seen or seen.add(u))]
-                            if year not in year_to_tracks:
-                                year_to_tracks[year] = []
-                            year_to_tracks[year].extend(unique)
-                    
-                    # Deduplicate tracks per year
-                    for year in year_to_tracks:
-                        seen = set()
-                        year_to_tracks[year] = [u for u in year_to_tracks[year] if not (u in seen or seen.add(u))]
+                            uris, seen = year_seen.setdefault(year, ([], set()))
+                            for u in group["_uri"]:
+                                if u not in seen:
+                                    seen.add(u)
+                                    uris.append(u)
+                    year_to_tracks = {year: uris for year, (uris, _) in year_seen.items()}
     except Exception as e:
         log(f"  ⚠️  Could not load liked songs data: {e}")
     
@@ -177,52 +166,72 @@ def consolidate_old_monthly_playlists(sp: spotipy.Spotify, keep_last_n_months: i
     # NOTE: Streaming history comes from periodic Spotify exports and may lag behind API data.
     # This is used for creating yearly playlists for previous years.
     # Missing or incomplete history will result in empty playlists for those years.
-    from src.analysis.streaming_history import load_streaming_history
-    history_df = load_streaming_history(DATA_DIR)
+    # The file is streamed batch by batch and reduced to per-(year, track) stats, so peak
+    # memory scales with the batch size rather than with the whole listening history.
+    from src.analysis.streaming_history import iter_streaming_history
     year_to_tracks_history = {}  # {year: {type: [uris]}}
+    year_play_counts = {}  # {year: {uri: play_count}} for re-sorting Top tracks
     
-    if history_df is not None and not history_df.empty:
-        try:
-            history_df['timestamp'] = pd.to_datetime(history_df['timestamp'], errors='coerce', utc=True)
-            history_df['year'] = history_df['timestamp'].dt.year
-            history_df['year_month'] = history_df['timestamp'].dt.to_period('M').astype(str)
-            
+    try:
+        partials = []
+        for batch in iter_streaming_history(
+            DATA_DIR, columns=["timestamp", "ms_played", "track_uri", "spotify_track_uri"]
+        ):
             # Get track URI column
-            track_col = None
-            if 'track_uri' in history_df.columns:
+            if 'track_uri' in batch.columns:
                 track_col = 'track_uri'
-            elif 'spotify_track_uri' in history_df.columns:
+            elif 'spotify_track_uri' in batch.columns:
                 track_col = 'spotify_track_uri'
-            
-            if track_col:
-                # Get ALL years from streaming history (not just old months)
-                # Top/Dscvr are created as yearly playlists only (no monthly). Vbz/Rpt removed.
-                for year in history_df['year'].unique():
-                    year_data = history_df[history_df['year'] == year].copy()
-                    if year not in year_to_tracks_history:
-                        year_to_tracks_history[year] = {}
-                    
-                    # Most played tracks for the year - KEPT for yearly playlists
-                    top_tracks = get_most_played_tracks(year_data, None, limit=100)
-                    if top_tracks:
-                        year_to_tracks_history[year]['most_played'] = top_tracks
-                    
-                    # Repeat tracks removed - OnRepeat no longer supported
-                    # repeat_tracks = get_repeat_tracks(year_data, None, min_repeats=3, limit=100)
-                    # if repeat_tracks:
-                    #     year_to_tracks_history[year]['repeat'] = repeat_tracks
-                    
-                    # Discovery tracks (first time played in this year) - KEPT for yearly playlists
-                    discovery_tracks = get_discovery_tracks(year_data, None, limit=100)
-                    if discovery_tracks:
-                        year_to_tracks_history[year]['discovery'] = discovery_tracks
-                    
-                    # Time-based tracks removed - Vibes no longer in yearly playlists
-                    # time_tracks = get_time_based_tracks(year_data, None, time_type="evening", limit=100)
-                    # if time_tracks:
-                    #     year_to_tracks_history[year]['time_based'] = time_tracks
-        except Exception as e:
-            log(f"  ⚠️  Could not process streaming history for consolidation: {e}")
+            else:
+                break
+            timestamps = pd.to_datetime(batch['timestamp'], errors='coerce', utc=True)
+            partials.append(
+                batch.assign(timestamp=timestamps, year=timestamps.dt.year)
+                .groupby(['year', track_col])
+                .agg(
+                    play_count=('ms_played', 'count'),
+                    total_ms=('ms_played', 'sum'),
+                    first_played=('timestamp', 'min'),
+                )
+                .rename_axis(['year', 'track_uri'])
+            )
+        
+        if partials:
+            track_stats = (
+                pd.concat(partials)
+                .groupby(level=['year', 'track_uri'])
+                .agg(
+                    play_count=('play_count', 'sum'),
+                    total_ms=('total_ms', 'sum'),
+                    first_played=('first_played', 'min'),
+                )
+                .reset_index()
+            )
+            # Keep only non-empty string URIs (see liked songs above)
+            track_stats = track_stats[track_stats['track_uri'].str.len() > 0]
+            # Get ALL years from streaming history (not just old months)
+            # Top/Dscvr are created as yearly playlists only (no monthly). Vbz/Rpt removed.
+            for year, year_stats in track_stats.groupby('year'):
+                year = int(year)
+                year_to_tracks_history[year] = {}
+                year_play_counts[year] = dict(zip(year_stats['track_uri'], year_stats['play_count']))
+                
+                # Most played tracks for the year - KEPT for yearly playlists
+                # (same ordering as get_most_played_tracks: play count, then total ms)
+                top_tracks = (
+                    year_stats.sort_values(['play_count', 'total_ms'], ascending=False)
+                    .head(100)['track_uri'].tolist()
+                )
+                if top_tracks:
+                    year_to_tracks_history[year]['most_played'] = top_tracks
+                
+                # Discovery tracks (first time played in this year) - KEPT for yearly playlists
+                # (same ordering as get_discovery_tracks: earliest first play first)
+                discovery_tracks = year_stats.sort_values('first_played').head(100)['track_uri'].tolist()
+                if discovery_tracks:
+                    year_to_tracks_history[year]['discovery'] = discovery_tracks
+    except Exception as e:
+        log(f"  ⚠️  Could not process streaming history for consolidation: {e}")
     
     # Consolidate years that have:
     # 1. Monthly playlists that need consolidation (for "Finds" only), OR
@@ -286,172 +295,149 @@ def consolidate_old_monthly_playlists(sp: spotipy.Spotify, keep_last_n_months: i
         if sources:
             log(f"    {year}: {', '.join(sources)}")
     
+    # Monthly track sets fetched while collecting, reused when verifying before deletion
+    # (monthly playlists are only read here, never modified)
+    fetched_tracks = {}  # {playlist_id: set of uris}
+    
     # For each old year, consolidate into yearly playlists for each type
     for year in sorted(years_to_consolidate):
         year_short = str(year)[2:] if len(str(year)) == 4 else str(year)
         
-        # Process each playlist type
-        for playlist_type, prefix in playlist_types.items():
-            # Collect all tracks for this year and type
-            # Use list to preserve ordering for "Top" and other ordered playlists
-            all_tracks_list = []
-            all_tracks_set = set()  # For deduplication
-            
-            # First, try to get tracks from existing monthly playlists of this type
-            if year in monthly_playlists and playlist_type in monthly_playlists[year]:
-                for monthly_name, monthly_id in monthly_playlists[year][playlist_type]:
-                    tracks = get_playlist_tracks(sp, monthly_id)
-                    # Preserve order from playlist (playlists are already ordered)
-                    for track in tracks:
-                        if track not in all_tracks_set:
-                            all_tracks_list.append(track)
-                            all_tracks_set.add(track)
-                    log(f"    - {monthly_name}: {len(tracks)} tracks")
-            
-            # If no tracks from playlists, use appropriate data source
-            if not all_tracks_list:
-                if playlist_type == "monthly" and year in year_to_tracks:
-                    # Use liked songs data for "Finds" playlists
-                    for track in year_to_tracks[year]:
-                        if track not in all_tracks_set:
-                            all_tracks_list.append(track)
-                            all_tracks_set.add(track)
-                    log(f"    - Using liked songs data for {playlist_type}: {len(year_to_tracks[year])} tracks")
-                elif playlist_type in ["most_played", "discovery"]:  # Top and Discovery kept (time_based/repeat removed)
-                    # Use streaming history data (already sorted)
-                    if year in year_to_tracks_history and playlist_type in year_to_tracks_history[year]:
-                        # These are already sorted by the get_*_tracks functions
-                        for track in year_to_tracks_history[year][playlist_type]:
-                            if track not in all_tracks_set:
-                                all_tracks_list.append(track)
-                                all_tracks_set.add(track)
-                        log(f"    - Using streaming history for {playlist_type}: {len(year_to_tracks_history[year][playlist_type])} tracks")
+        # Process each enabled playlist type with its specialized handler
+        for playlist_type, handler in _CONSOLIDATION_HANDLERS.items():
+            if playlist_type not in playlist_types:
+                continue
+            monthly_for_type = monthly_playlists.get(year, {}).get(playlist_type, [])
             
-            # Re-sort tracks by play count if we got them from monthly playlists
-            # Note: If tracks came from year_to_tracks_history, they're already sorted, so we skip re-sorting
-            tracks_from_monthly = year in monthly_playlists and playlist_type in monthly_playlists.get(year, {})
-            if all_tracks_list and playlist_type in ["most_played", "discovery"] and tracks_from_monthly:
-                # If we have streaming history for this year, re-sort by actual play counts
-                if history_df is not None and not history_df.empty:
-                    try:
-                        # Filter to this year's data
-                        year_data = history_df[history_df['year'] == year].copy()
-                        if not year_data.empty:
-                            # Get track URI column
-                            track_col = None
-                            if 'track_uri' in year_data.columns:
-                                track_col = 'track_uri'
-                            elif 'spotify_track_uri' in year_data.columns:
-                                track_col = 'spotify_track_uri'
-                            
-                            if track_col:
-                                # Calculate play counts for all tracks
-                                track_stats = year_data.groupby(track_col).agg({
-                                    'ms_played': ['count', 'sum']
-                                }).reset_index()
-                                track_stats.columns = ['track_uri', 'play_count', 'total_ms']
-                                
-                                # Create a mapping of track URI to play count
-                                play_count_map = dict(zip(track_stats['track_uri'], track_stats['play_count']))
-                                
-                                # Sort tracks by play count (most played first)
-                                # Tracks not in history get play_count = 0
-                                if playlist_type == "most_played":
-                                    all_tracks_list.sort(
-                                        key=lambda uri: (play_count_map.get(uri, 0), 0),
-                                        reverse=True
-                                    )
-                                    log(f"    - Re-sorted {playlist_type} tracks by play count")
-                                # Discovery tracks are already sorted by first play time (most recent first)
-                                # from get_discovery_tracks, so we keep that order
-                    except Exception as e:
-                        log(f"    ⚠️  Could not re-sort tracks by play count: {e}")
-                        # Continue with existing order if sorting fails
+            # First, collect tracks from existing monthly playlists of this type
+            # Use list to preserve ordering for "Top" and other ordered playlists
+            from_monthly = []
+            seen = set()  # For deduplication
+            for monthly_name, monthly_id in monthly_for_type:
+                tracks = get_playlist_tracks(sp, monthly_id)
+                fetched_tracks[monthly_id] = tracks
+                for track in tracks:
+                    if track not in seen:
+                        from_monthly.append(track)
+                        seen.add(track)
+                log(f"    - {monthly_name}: {len(tracks)} tracks")
             
-            if not all_tracks_list:
+            playlist_name, description, filtered_tracks = handler(
+                year, year_short, from_monthly, year_to_tracks, year_to_tracks_history, year_play_counts
+            )
+            if not filtered_tracks:
                 log(f"    ⚠️  No tracks found for {year} ({playlist_type}), skipping")
                 continue
             
-            # Create yearly playlist for this type
-            if playlist_type == "monthly":
-                main_playlist_name = format_yearly_playlist_name(str(year))
-                playlist_configs = [(main_playlist_name, "All tracks", None)]
-            else:
-                # For other types, create single yearly playlist
-                # Use yearly template format (no month) for yearly playlists
-                # The templates default to monthly format, so we use YEARLY_NAME_TEMPLATE as base
-                # but with the appropriate prefix for each type
-                yearly_name = format_playlist_name(YEARLY_NAME_TEMPLATE, year=year_short, playlist_type=playlist_type)
-                playlist_configs = [
-                    (yearly_name, f"{playlist_type.replace('_', ' ').title()} tracks", None),
-                ]
-            
-            for playlist_name, description, genre_filter in playlist_configs:
-                filtered_tracks = all_tracks_list
-                if not filtered_tracks:
-                    log(f"    ⚠️  No tracks for {year}, skipping {playlist_name}")
+            # Create or update playlist
+            if playlist_name in existing:
+                # If we're not consolidating from monthly playlists (they were already deleted),
+                # and the playlist already exists, skip the expensive check
+                if year not in monthly_playlists:
+                    log(f"  {playlist_name}: already consolidated (skipping check)")
                     continue
-                # Create or update playlist
-                if playlist_name in existing:
-                    # If we're not consolidating from monthly playlists (they were already deleted),
-                    # and the playlist already exists, skip the expensive check
-                    if year not in monthly_playlists:
-                        log(f"  {playlist_name}: already consolidated (skipping check)")
-                        continue
-                    pid = existing[playlist_name]
-                    already = get_playlist_tracks(sp, pid)
-                    to_add = [u for u in filtered_tracks if u and isinstance(u, str) and u not in already]
-                    if to_add:
-                        for chunk in _chunked(to_add, 50):
-                            valid = [u for u in chunk if u and isinstance(u, str)]
-                            if valid:
-                                api_call(sp.playlist_add_items, pid, valid)
-                        log(f"  {playlist_name}: +{len(to_add)} tracks (total: {len(filtered_tracks)}; manually added tracks preserved)")
-                        _update_playlist_description_with_genres(sp, user_id, pid, None)
-                    else:
-                        log(f"  {playlist_name}: already up to date ({len(filtered_tracks)} tracks)")
-                        _update_playlist_description_with_genres(sp, user_id, pid, None)
+                pid = existing[playlist_name]
+                already = get_playlist_tracks(sp, pid)
+                to_add = [u for u in filtered_tracks if u not in already]
+                if to_add:
+                    for chunk in _chunked(to_add, 50):
+                        api_call(sp.playlist_add_items, pid, chunk)
+                    log(f"  {playlist_name}: +{len(to_add)} tracks (total: {len(filtered_tracks)}; manually added tracks preserved)")
+                    _update_playlist_description_with_genres(sp, user_id, pid, None)
                 else:
-                    pl = api_call(
-                        sp.user_playlist_create,
-                        user_id,
-                        playlist_name,
-                        public=False,
-                        description=format_playlist_description(description, period=str(year), playlist_type=playlist_type),
-                    )
-                    pid = pl["id"]
-                    valid_tracks = [u for u in filtered_tracks if u and isinstance(u, str)]
-                    for chunk in _chunked(valid_tracks, 50):
-                        if chunk:
-                            api_call(sp.playlist_add_items, pid, chunk)
-                    _update_playlist_description_with_genres(sp, user_id, pid, valid_tracks)
-                    log(f"  {playlist_name}: created with {len(valid_tracks)} tracks")
-                # Delete old monthly playlists if they existed (with verification)
-                if year in monthly_playlists and playlist_type in monthly_playlists[year]:
-                    final_yearly_tracks = get_playlist_tracks(sp, pid, force_refresh=True)
-                    for monthly_name, monthly_id in monthly_playlists[year][playlist_type]:
-                        try:
+                    log(f"  {playlist_name}: already up to date ({len(filtered_tracks)} tracks)")
+                    _update_playlist_description_with_genres(sp, user_id, pid, None)
+            else:
+                pl = api_call(
+                    sp.user_playlist_create,
+                    user_id,
+                    playlist_name,
+                    public=False,
+                    description=format_playlist_description(description, period=str(year), playlist_type=playlist_type),
+                )
+                pid = pl["id"]
+                for chunk in _chunked(filtered_tracks, 50):
+                    api_call(sp.playlist_add_items, pid, chunk)
+                _update_playlist_description_with_genres(sp, user_id, pid, filtered_tracks)
+                log(f"  {playlist_name}: created with {len(filtered_tracks)} tracks")
+            # Delete old monthly playlists if they existed (with verification)
+            if monthly_for_type:
+                final_yearly_tracks = get_playlist_tracks(sp, pid, force_refresh=True)
+                for monthly_name, monthly_id in monthly_for_type:
+                    try:
+                        monthly_tracks = fetched_tracks.get(monthly_id)
+                        if monthly_tracks is None:
                             monthly_tracks = get_playlist_tracks(sp, monthly_id, force_refresh=True)
-                            missing_tracks = monthly_tracks - final_yearly_tracks
-                            if missing_tracks:
-                                log(f"    ⚠️  WARNING: {len(missing_tracks)} tracks from '{monthly_name}' are NOT in yearly playlist!")
-                                continue
-                            from .data_protection import safe_delete_playlist
-                            success, backup_file = safe_delete_playlist(
-                                sp, monthly_id, monthly_name,
-                                create_backup=True,
-                                verify_tracks_preserved_in=pid
-                            )
-                            if success:
-                                _invalidate_playlist_cache()
-                                log(f"    ✓ Deleted {monthly_name} ({len(monthly_tracks)} tracks verified)")
-                            elif backup_file:
-                                log(f"    💾 Backup created: {backup_file.name}")
-                        except Exception as e:
-                            log(f"    ⚠️  Failed to delete {monthly_name}: {e}")
+                        missing_tracks = monthly_tracks.difference(final_yearly_tracks)
+                        if missing_tracks:
+                            log(f"    ⚠️  WARNING: {len(missing_tracks)} tracks from '{monthly_name}' are NOT in yearly playlist!")
+                            continue
+                        from .data_protection import safe_delete_playlist
+                        success, backup_file = safe_delete_playlist(
+                            sp, monthly_id, monthly_name,
+                            create_backup=True,
+                            verify_tracks_preserved_in=pid
+                        )
+                        if success:
+                            _invalidate_playlist_cache()
+                            log(f"    ✓ Deleted {monthly_name} ({len(monthly_tracks)} tracks verified)")
+                        elif backup_file:
+                            log(f"    💾 Backup created: {backup_file.name}")
+                    except Exception as e:
+                        log(f"    ⚠️  Failed to delete {monthly_name}: {e}")
         log(f"  ✅ Consolidated {year} into yearly playlists for all types")
 
 
+# Per-type consolidation handlers. Each takes the tracks collected from that type's monthly
+# playlists plus the year-level data sources, and returns (playlist_name, description, tracks).
+
+def _consolidate_finds(year, year_short, from_monthly, year_to_tracks, year_to_tracks_history, year_play_counts):
+    """Finds: monthly playlist tracks, else liked songs added during the year."""
+    from .sync import log
+    tracks = from_monthly
+    if not tracks and year in year_to_tracks:
+        tracks = year_to_tracks[year]
+        log(f"    - Using liked songs data for monthly: {len(tracks)} tracks")
+    return format_yearly_playlist_name(str(year)), "All tracks", tracks
+
+
+def _consolidate_top(year, year_short, from_monthly, year_to_tracks, year_to_tracks_history, year_play_counts):
+    """Top: monthly playlist tracks re-sorted by play count, else the year's most played."""
+    from .sync import log, YEARLY_NAME_TEMPLATE
+    tracks = from_monthly
+    if tracks:
+        # If we have streaming history for this year, re-sort by actual play counts
+        # Tracks not in history get play_count = 0
+        play_count_map = year_play_counts.get(year)
+        if play_count_map:
+            tracks.sort(key=lambda uri: play_count_map.get(uri, 0), reverse=True)
+            log("    - Re-sorted most_played tracks by play count")
+    else:
+        # Streaming history lists are already sorted by play count
+        tracks = year_to_tracks_history.get(year, {}).get("most_played", [])
+        if tracks:
+            log(f"    - Using streaming history for most_played: {len(tracks)} tracks")
+    name = format_playlist_name(YEARLY_NAME_TEMPLATE, year=year_short, playlist_type="most_played")
+    return name, "Most Played tracks", tracks
+
+
+def _consolidate_discovery(year, year_short, from_monthly, year_to_tracks, year_to_tracks_history, year_play_counts):
+    """Discovery: monthly playlist tracks, else the year's first plays (already in first-play order)."""
+    from .sync import log, YEARLY_NAME_TEMPLATE
+    tracks = from_monthly
+    if not tracks:
+        tracks = year_to_tracks_history.get(year, {}).get("discovery", [])
+        if tracks:
+            log(f"    - Using streaming history for discovery: {len(tracks)} tracks")
+    name = format_playlist_name(YEARLY_NAME_TEMPLATE, year=year_short, playlist_type="discovery")
+    return name, "Discovery tracks", tracks
+
+
+_CONSOLIDATION_HANDLERS = {
+    "monthly": _consolidate_finds,
+    "most_played": _consolidate_top,
+    "discovery": _consolidate_discovery,
+}
 
 
 def delete_old_monthly_playlists(sp: spotipy.Spotify) -> None:
@@ -460,28 +446,36 @@ def delete_old_monthly_playlists(sp: spotipy.Spotify) -> None:
     log("\n--- Deleting Old Monthly Playlists (no-op) ---")
 
 
+# Old genre split: prefix + HipHop/Dance/Other + year, or master "Am" + genre
+_AUTOMATED_GENRE_RE = re.compile(r"HipHop|Hip Hop|Dance|Other|Am")
+
+
+@lru_cache(maxsize=8)
+def _automated_monthly_re(owner: str, prefixes: tuple, month_abbrs: tuple) -> "re.Pattern":
+    """Compile {owner}{prefix}{month}{year} once per (owner, prefixes, months) combination."""
+    prefix_alt = "|".join(re.escape(p) for p in prefixes)
+    month_alt = "|".join(re.escape(m) for m in month_abbrs)
+    return re.compile(rf"{re.escape(owner)}(?P<prefix>{prefix_alt})(?P<mon>{month_alt})(?P<year>\d+)")
+
+
+def _owned_playlists(existing: dict, owner: str) -> list:
+    """(name, id) pairs from {name: id} whose name starts with the owner prefix."""
+    return [(name, pid) for name, pid in existing.items() if name.startswith(owner)]
+
+
 def _is_automated_monthly_playlist(name: str, owner: str, prefixes: list, month_abbrs: list) -> bool:
     """True if name matches {owner}{prefix}{month}{year} e.g. AJFindsJan26."""
-    if not name or not name.startswith(owner):
+    if not name:
         return False
-    suffix = name[len(owner):]
-    for prefix in prefixes:
-        if suffix.startswith(prefix):
-            rest = suffix[len(prefix):]
-            for abbr in month_abbrs:
-                if rest.startswith(abbr) and len(rest) > len(abbr) and rest[len(abbr):].isdigit():
-                    return True
-    return False
+    pattern = _automated_monthly_re(owner, tuple(prefixes), tuple(month_abbrs))
+    return pattern.fullmatch(name) is not None
 
 
 def _is_automated_genre_playlist(name: str, owner: str) -> bool:
     """True if name looks like an automated genre playlist (HipHop, Dance, Other, or AJAm master)."""
     if not name or not name.startswith(owner):
         return False
-    rest = name[len(owner):]
-    # Old genre split: prefix + HipHop/Dance/Other + year, or master "Am" + genre
-    genre_slugs = ("HipHop", "Hip Hop", "Dance", "Other", "Am")
-    return any(s in rest for s in genre_slugs)
+    return _AUTOMATED_GENRE_RE.search(name, len(owner)) is not None
 
 
 @handle_errors(reraise=False, default_return=None, log_error=True)
@@ -513,9 +507,7 @@ def delete_automated_monthly_and_genre_playlists(sp: spotipy.Spotify) -> None:
         yearly_names.add(format_playlist_name(YEARLY_NAME_TEMPLATE, year=year_short, playlist_type="most_played"))
         yearly_names.add(format_playlist_name(YEARLY_NAME_TEMPLATE, year=year_short, playlist_type="discovery"))
 
-    for playlist_name, playlist_id in list(existing.items()):
-        if not playlist_name.startswith(owner):
-            continue
+    for playlist_name, playlist_id in _owned_playlists(existing, owner):
         if playlist_name in yearly_names:
             continue
         if _is_automated_monthly_playlist(playlist_name, owner, prefixes, month_abbrs):
@@ -560,6 +552,7 @@ def delete_duplicate_playlists(sp: spotipy.Spotify) -> None:
         log, get_existing_playlists, get_user_info, get_playlist_tracks,
         api_call, _invalidate_playlist_cache
     )
+    from .data_protection import safe_delete_playlist
     log("\n--- Detecting and Deleting Duplicate Playlists ---")
     
     existing = get_existing_playlists(sp, force_refresh=True)
@@ -582,62 +575,70 @@ def delete_duplicate_playlists(sp: spotipy.Spotify) -> None:
         return
     
     # Build track set for each playlist
+    # Fetches are I/O-bound (API or cache), so run them on a small thread pool;
+    # bucketing happens on this thread as results complete.
     playlist_track_sets = {}
     checked = 0
-    for name, playlist_id in existing.items():
-        try:
-            tracks = get_playlist_tracks(sp, playlist_id, force_refresh=False)  # Use cache if available
-            # Convert to frozenset for comparison (order doesn't matter)
-            track_set = frozenset(tracks)
-            if track_set in playlist_track_sets:
-                # Found a duplicate - add to the list
-                playlist_track_sets[track_set].append((name, playlist_id))
-            else:
-                playlist_track_sets[track_set] = [(name, playlist_id)]
+    with ThreadPoolExecutor(max_workers=PARALLEL_MAX_WORKERS) as executor:
+        futures = {
+            executor.submit(get_playlist_tracks, sp, playlist_id, force_refresh=False): (name, playlist_id)  # Use cache if available
+            for name, playlist_id in existing.items()
+        }
+        for future in as_completed(futures):
+            name, playlist_id = futures[future]
+            try:
+                tracks = future.result()
+            except Exception as e:
+                log(f"  ⚠️  Could not read tracks from '{name}': {e}")
+                continue
             checked += 1
+            # Empty playlists are never treated as duplicates, so don't bucket them
+            if tracks:
+                # tracks is a frozenset (order doesn't matter), so duplicates land in the same bucket
+                playlist_track_sets.setdefault(tracks, []).append((name, playlist_id))
             if checked % 50 == 0:
                 log(f"  Progress: checked {checked}/{len(existing)} playlists...")
-        except Exception as e:
-            log(f"  ⚠️  Could not read tracks from '{name}': {e}")
-            continue
     
     # Find duplicates (playlists with same track set)
+    to_delete = []
+    duplicate_groups = (
+        (track_set, playlists)
+        for track_set, playlists in playlist_track_sets.items()
+        if len(playlists) > 1
+    )
+    for track_set, playlists in duplicate_groups:
+        # Sort by name to keep the first one (alphabetically)
+        playlists_sorted = sorted(playlists, key=lambda x: x[0])
+        keep_playlist = playlists_sorted[0]
+        duplicates = playlists_sorted[1:]
+        
+        log(f"  🔍 Found {len(playlists)} duplicate playlist(s) with {len(track_set)} tracks:")
+        log(f"     ✅ Keeping: '{keep_playlist[0]}'")
+        to_delete.extend((dup_name, dup_id, keep_playlist) for dup_name, dup_id in duplicates)
+    
+    # Delete in one pass, then invalidate the playlist cache once
     deleted_count = 0
-    for track_set, playlists in playlist_track_sets.items():
-        if len(playlists) > 1 and len(track_set) > 0:  # Only consider non-empty playlists
-            # Sort by name to keep the first one (alphabetically)
-            playlists_sorted = sorted(playlists, key=lambda x: x[0])
-            keep_playlist = playlists_sorted[0]
-            duplicates = playlists_sorted[1:]
-            
-            log(f"  🔍 Found {len(playlists)} duplicate playlist(s) with {len(track_set)} tracks:")
-            log(f"     ✅ Keeping: '{keep_playlist[0]}'")
-            
-            for dup_name, dup_id in duplicates:
-                try:
-                    # Safe deletion with backup and verification
-                    from .data_protection import safe_delete_playlist
-                    # Verify tracks are preserved in the kept playlist
-                    success, backup_file = safe_delete_playlist(
-                        sp, dup_id, dup_name,
-                        create_backup=True,
-                        verify_tracks_preserved_in=keep_playlist[1]  # Verify in kept playlist
-                    )
-                    if success:
-                        log(f"     🗑️  Deleted: '{dup_name}'")
-                        deleted_count += 1
-                        # Remove from cache
-                        _invalidate_playlist_cache()
-                        if dup_name in existing:
-                            del existing[dup_name]
-                    else:
-                        log(f"     ⚠️  Skipped deletion of '{dup_name}' (safety check failed)")
-                        if backup_file:
-                            log(f"     💾 Backup created: {backup_file.name}")
-                except Exception as e:
-                    log(f"     ⚠️  Failed to delete '{dup_name}': {e}")
+    for dup_name, dup_id, keep_playlist in to_delete:
+        try:
+            # Safe deletion with backup and verification
+            # Verify tracks are preserved in the kept playlist
+            success, backup_file = safe_delete_playlist(
+                sp, dup_id, dup_name,
+                create_backup=True,
+                verify_tracks_preserved_in=keep_playlist[1]  # Verify in kept playlist
+            )
+            if success:
+                log(f"     🗑️  Deleted: '{dup_name}'")
+                deleted_count += 1
+            else:
+                log(f"     ⚠️  Skipped deletion of '{dup_name}' (safety check failed)")
+                if backup_file:
+                    log(f"     💾 Backup created: {backup_file.name}")
+        except Exception as e:
+            log(f"     ⚠️  Failed to delete '{dup_name}': {e}")
     
     if deleted_count > 0:
+        _invalidate_playlist_cache()
         log(f"  ✅ Deleted {deleted_count} duplicate playlist(s)")
     else:
         log("  ℹ️  No duplicate playlists found")
@@ -43,7 +43,7 @@ def create_or_update_playlist(
     from .sync import (
         log, verbose_log, DATA_DIR, ENABLE_MONTHLY, ENABLE_MOST_PLAYED, ENABLE_DISCOVERY,
         LIKED_SONGS_PLAYLIST_ID, get_playlist_tracks, api_call,
-        _chunked, _update_playlist_description_with_genres, _playlist_tracks_cache,
+        _chunked, _update_playlist_description_with_genres, evict_playlist_tracks,
         _invalidate_playlist_cache
     )
     
@@ -59,8 +59,7 @@ def create_or_update_playlist(
             for chunk in _chunked(to_add, 50):
                 api_call(sp.playlist_add_items, pid, chunk)
             # Invalidate cache
-            if pid in _playlist_tracks_cache:
-                del _playlist_tracks_cache[pid]
+            evict_playlist_tracks(pid)
             log(f"  {playlist_name}: +{len(to_add)} tracks (total: {len(track_uris)})")
             # Update description with genre tags
             _update_playlist_description_with_genres(sp, user_id, pid, track_uris)
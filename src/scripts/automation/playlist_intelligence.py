@@ -9,14 +9,20 @@ Creative enhancements for playlist management including:
 - Auto-arrangement suggestions
 """
 
-import spotipy
-import pandas as pd
-from typing import Dict, List, Tuple, Optional, Set
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, Iterable, List, Tuple, Optional, Set, Union
 from datetime import datetime, timedelta
-from collections import Counter, defaultdict
+import io
+from collections import defaultdict
 import math
+import weakref
 
-from .sync import DATA_DIR, log, verbose_log
+# numpy/pandas are imported inside the functions that need them, so set-only callers
+# (calculate_playlist_similarity) do not pay their import cost
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
 
 def calculate_playlist_similarity(
     playlist1_tracks: Set[str],
@@ -31,60 +37,279 @@ def calculate_playlist_similarity(
     if not playlist1_tracks or not playlist2_tracks:
         return 0.0
     
+    # |A ∪ B| = |A| + |B| - |A ∩ B|, so only the intersection is traversed
     intersection = len(playlist1_tracks & playlist2_tracks)
-    union = len(playlist1_tracks | playlist2_tracks)
+    union = len(playlist1_tracks) + len(playlist2_tracks) - intersection
     
     return intersection / union if union > 0 else 0.0
 
 
+# With approximate=True, above this many playlists candidate pairs come from MinHash LSH
+# (requires the optional datasketch dependency: pip install "spotim8[similarity]")
+LSH_MIN_PLAYLISTS = 500
+LSH_NUM_PERM = 128
+
+
+def _lsh_candidate_pairs(
+    playlist_tracks: Dict[str, Set[str]],
+    threshold: float
+) -> Optional[Set[Tuple[str, str]]]:
+    """
+    Candidate playlist pairs likely to reach threshold, via MinHash signatures + LSH banding.
+    
+    Returns None when datasketch is not installed. Pairs are ordered as in playlist_tracks.
+    """
+    try:
+        from datasketch import MinHash, MinHashLSH
+    except ImportError:
+        return None
+    
+    lsh = MinHashLSH(threshold=threshold, num_perm=LSH_NUM_PERM)
+    signatures = {}
+    for pid, tracks in playlist_tracks.items():
+        if not tracks:
+            continue
+        signature = MinHash(num_perm=LSH_NUM_PERM)
+        for track_id in tracks:
+            signature.update(str(track_id).encode("utf-8"))
+        lsh.insert(pid, signature)
+        signatures[pid] = signature
+    
+    order = {pid: i for i, pid in enumerate(playlist_tracks)}
+    candidates = set()
+    for pid, signature in signatures.items():
+        for other in lsh.query(signature):
+            if order[other] > order[pid]:
+                candidates.add((pid, other))
+    return candidates
+
+
+def _jaccard_pairs(
+    playlist_tracks: Dict[str, Set[str]],
+    threshold: float,
+    approximate: bool = False
+) -> List[Tuple[str, str, float]]:
+    """
+    Find all playlist pairs whose Jaccard similarity is at least threshold.
+    
+    With scipy installed, playlists become rows of a sparse playlist x track matrix and
+    every pairwise intersection comes from a single sparse product M @ M.T; only pairs
+    that share at least one track are materialized. Without scipy (or for threshold <= 0,
+    where disjoint pairs also qualify) it compares pairwise sets, pruned by size ratio.
+    
+    With approximate=True, libraries with more than LSH_MIN_PLAYLISTS playlists use
+    MinHash LSH (when datasketch is installed) to find candidate pairs and only confirm
+    those exactly; this can miss a pair that sits just above the threshold. By default
+    results are exact.
+    
+    Returns:
+        List of (playlist_id1, playlist_id2, similarity_score) tuples
+    """
+    import numpy as np
+    import pandas as pd
+    
+    playlist_ids = list(playlist_tracks.keys())
+    
+    if approximate and len(playlist_ids) > LSH_MIN_PLAYLISTS and 0 < threshold <= 1:
+        candidates = _lsh_candidate_pairs(playlist_tracks, threshold)
+        if candidates is not None:
+            pairs = []
+            for pid1, pid2 in candidates:
+                similarity = calculate_playlist_similarity(
+                    playlist_tracks[pid1],
+                    playlist_tracks[pid2]
+                )
+                if similarity >= threshold:
+                    pairs.append((pid1, pid2, similarity))
+            return pairs
+    
+    try:
+        from scipy import sparse
+    except ImportError:
+        sparse = None
+    if sparse is None or threshold <= 0:
+        return _set_jaccard_pairs(playlist_tracks, threshold)
+    
+    sizes = np.fromiter(
+        (len(playlist_tracks[pid]) for pid in playlist_ids), dtype=np.int64, count=len(playlist_ids)
+    )
+    if not sizes.sum():
+        return []
+    rows = np.repeat(np.arange(len(playlist_ids)), sizes)
+    # factorize needs an array-like (a plain list raises TypeError on pandas 3)
+    all_tracks = np.fromiter(
+        (t for pid in playlist_ids for t in playlist_tracks[pid]), dtype=object, count=int(sizes.sum())
+    )
+    cols, vocab = pd.factorize(all_tracks, use_na_sentinel=False)
+    
+    matrix = sparse.csr_matrix(
+        (np.ones(len(cols), dtype=np.int32), (rows, cols)),
+        shape=(len(playlist_ids), len(vocab))
+    )
+    # Upper triangle of M @ M.T: intersection sizes for pairs i < j that overlap
+    overlaps = sparse.triu(matrix @ matrix.T, k=1).tocoo()
+    union = sizes[overlaps.row] + sizes[overlaps.col] - overlaps.data
+    similarity = overlaps.data / union
+    keep = similarity >= threshold
+    return [
+        (playlist_ids[i], playlist_ids[j], float(sim))
+        for i, j, sim in zip(overlaps.row[keep], overlaps.col[keep], similarity[keep])
+    ]
+
+
+def _set_jaccard_pairs(
+    playlist_tracks: Dict[str, Set[str]],
+    threshold: float
+) -> List[Tuple[str, str, float]]:
+    """Pairwise-set strategy of _jaccard_pairs (no scipy, or threshold <= 0)."""
+    playlist_ids = list(playlist_tracks.keys())
+    # Jaccard can never exceed |smaller| / |larger|, so walk playlists largest first and
+    # stop each inner loop once the remaining (smaller) playlists cannot reach threshold
+    position = {pid: i for i, pid in enumerate(playlist_ids)}
+    track_counts = {pid: len(tracks) for pid, tracks in playlist_tracks.items()}
+    by_size = sorted(playlist_ids, key=track_counts.get, reverse=True)
+    pairs = []
+    for i, pid1 in enumerate(by_size):
+        min_size = threshold * track_counts[pid1]
+        for pid2 in by_size[i+1:]:
+            if track_counts[pid2] < min_size:
+                break
+            similarity = calculate_playlist_similarity(
+                playlist_tracks[pid1],
+                playlist_tracks[pid2]
+            )
+            if similarity >= threshold:
+                first, second = sorted((pid1, pid2), key=position.get)
+                pairs.append((first, second, similarity))
+    return pairs
+
+
+# Last index built by build_playlist_track_index: (weakref to df, len(df), index)
+_track_index_cache: Optional[Tuple[weakref.ref, int, Dict[str, frozenset]]] = None
+
+
+def build_playlist_track_index(playlist_tracks_df: pd.DataFrame) -> Dict[str, frozenset]:
+    """
+    Build a playlist_id -> frozenset(track_id) index in one grouped pass.
+    
+    The most recent result is reused when called again with the same
+    (unchanged-length) DataFrame, so callers can share one index.
+    """
+    global _track_index_cache
+    if _track_index_cache is not None:
+        df_ref, cached_len, cached_index = _track_index_cache
+        if df_ref() is playlist_tracks_df and cached_len == len(playlist_tracks_df):
+            return cached_index
+    
+    grouped = playlist_tracks_df.groupby("playlist_id")["track_id"].unique()
+    index = {playlist_id: frozenset(tracks) for playlist_id, tracks in grouped.items()}
+    _track_index_cache = (weakref.ref(playlist_tracks_df), len(playlist_tracks_df), index)
+    return index
+
+
 def find_similar_playlists(
     playlists_df: pd.DataFrame,
     playlist_tracks_df: pd.DataFrame,
-    threshold: float = 0.3
+    threshold: float = 0.3,
+    track_index: Optional[Dict[str, frozenset]] = None,
+    approximate: bool = False
 ) -> List[Tuple[str, str, float]]:
     """
     Find playlists with similar track content.
     
     Args:
         threshold: Minimum similarity score (0.0-1.0)
+        track_index: Prebuilt index from build_playlist_track_index (optional)
+        approximate: Allow MinHash LSH candidate search on large libraries (may miss pairs)
     
     Returns:
         List of (playlist1_name, playlist2_name, similarity_score) tuples
     """
-    # Build track sets for each playlist
-    playlist_tracks = {}
-    for _, row in playlists_df.iterrows():
-        playlist_id = row["playlist_id"]
-        tracks = playlist_tracks_df[playlist_tracks_df["playlist_id"] == playlist_id]
-        playlist_tracks[playlist_id] = set(tracks["track_id"].unique())
+    if track_index is None:
+        track_index = build_playlist_track_index(playlist_tracks_df)
+    playlist_tracks = {
+        playlist_id: track_index.get(playlist_id, frozenset())
+        for playlist_id in playlists_df["playlist_id"]
+    }
+    
+    # Resolve names once (first row per playlist_id, as the old per-pair lookup did)
+    first_rows = playlists_df.drop_duplicates("playlist_id")
+    name_of = dict(zip(first_rows["playlist_id"], first_rows["name"]))
     
     # Calculate similarities
     similar = []
-    playlist_ids = list(playlist_tracks.keys())
-    
-    for i, pid1 in enumerate(playlist_ids):
-        for pid2 in playlist_ids[i+1:]:
-            similarity = calculate_playlist_similarity(
-                playlist_tracks[pid1],
-                playlist_tracks[pid2]
-            )
-            if similarity >= threshold:
-                name1 = playlists_df[playlists_df["playlist_id"] == pid1]["name"].iloc[0]
-                name2 = playlists_df[playlists_df["playlist_id"] == pid2]["name"].iloc[0]
-                similar.append((name1, name2, similarity))
+    for pid1, pid2, similarity in _jaccard_pairs(playlist_tracks, threshold, approximate):
+        similar.append((name_of[pid1], name_of[pid2], similarity))
     
     # Sort by similarity (highest first)
     similar.sort(key=lambda x: x[2], reverse=True)
     return similar
 
 
+# Dtypes applied by compact_streaming_history (only to columns that are present)
+STREAMING_HISTORY_DTYPES = {
+    "artist_name": "category",
+    "track_name": "category",
+    "ms_played": "int32",
+}
+
+
+def compact_streaming_history(streaming_history_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Shrink a freshly loaded streaming history for analysis.
+    
+    Repeated artist/track strings become categoricals and ms_played is downcast to
+    int32 (skipped if it holds nulls), which makes value_counts and masks cheaper.
+    """
+    import pandas as pd
+    
+    dtypes = {}
+    for column, dtype in STREAMING_HISTORY_DTYPES.items():
+        if column not in streaming_history_df.columns:
+            continue
+        if dtype == "int32" and not pd.api.types.is_integer_dtype(streaming_history_df[column]):
+            continue
+        dtypes[column] = dtype
+    return streaming_history_df.astype(dtypes) if dtypes else streaming_history_df
+
+
+def _top_counts(counts: pd.Series, n: int) -> Dict[str, int]:
+    """Largest n entries of a value_counts result, ignoring unused categories of a categorical column."""
+    counts = counts.head(n)
+    return counts[counts > 0].to_dict()
+
+
+def _merge_counts(total: Optional[pd.Series], counts: pd.Series) -> pd.Series:
+    """Add one batch's value_counts into the running total (kept sorted by count)."""
+    if total is None:
+        return counts
+    return total.add(counts, fill_value=0).astype("int64").sort_values(ascending=False, kind="stable")
+
+
+def _parsed_timestamps(streaming_history_df: pd.DataFrame) -> pd.Series:
+    """The "timestamp" column as datetimes (parsed if needed; the frame is left untouched)."""
+    import pandas as pd
+    
+    timestamps = streaming_history_df["timestamp"]
+    if not pd.api.types.is_datetime64_any_dtype(timestamps):
+        timestamps = pd.to_datetime(timestamps, format="ISO8601", cache=True, errors="coerce")
+    return timestamps
+
+
 def analyze_listening_patterns(
-    streaming_history_df: pd.DataFrame,
+    streaming_history: Union[pd.DataFrame, Iterable[pd.DataFrame]],
     days: int = 30
 ) -> Dict[str, any]:
     """
     Analyze listening patterns over the last N days.
     
+    Accepts a DataFrame or an iterable of DataFrame batches (e.g. parquet row
+    batches); batches are filtered and counted one at a time, so only the running
+    counts are kept in memory.
+    
+    Pass a whole-frame history through compact_streaming_history once at load
+    time; this function only takes views of it and never modifies it.
+    
     Returns:
         Dictionary with insights:
         - top_artists: Most listened artists
@@ -94,46 +319,67 @@ def analyze_listening_patterns(
         - genre_distribution: Genre breakdown
         - discovery_rate: New tracks discovered
     """
-    if streaming_history_df.empty:
-        return {}
+    import pandas as pd
     
+    batches = [streaming_history] if isinstance(streaming_history, pd.DataFrame) else streaming_history
     cutoff_date = datetime.now() - timedelta(days=days)
     
-    # Filter to recent data
-    if "timestamp" in streaming_history_df.columns:
-        recent = streaming_history_df[
-            pd.to_datetime(streaming_history_df["timestamp"]) >= cutoff_date
-        ].copy()
-    else:
-        recent = streaming_history_df.copy()
-    
-    if recent.empty:
+    recent_rows = 0
+    artist_counts = track_counts = hour_counts = None
+    total_ms = None
+    for batch in batches:
+        if batch.empty:
+            continue
+        
+        # Filter to recent data (timestamps parsed once per batch; reused for peak hours)
+        hours = None
+        if "timestamp" in batch.columns:
+            timestamps = _parsed_timestamps(batch)
+            is_recent = timestamps >= cutoff_date
+            recent = batch.loc[is_recent]
+            hours = timestamps[is_recent].dt.hour
+        else:
+            recent = batch
+        
+        if recent.empty:
+            continue
+        recent_rows += len(recent)
+        
+        if "artist_name" in recent.columns:
+            artist_counts = _merge_counts(artist_counts, recent["artist_name"].value_counts())
+        # Keep missing names: the discovery rate counts them as one distinct track
+        if "track_name" in recent.columns:
+            track_counts = _merge_counts(track_counts, recent["track_name"].value_counts(dropna=False))
+        if "ms_played" in recent.columns:
+            total_ms = (total_ms or 0) + int(recent["ms_played"].sum())
+        if hours is not None:
+            hour_counts = _merge_counts(hour_counts, hours.value_counts())
+    
+    if recent_rows == 0:
         return {}
     
     insights = {}
     
     # Top artists
-    if "artist_name" in recent.columns:
-        insights["top_artists"] = recent["artist_name"].value_counts().head(10).to_dict()
+    if artist_counts is not None:
+        insights["top_artists"] = _top_counts(artist_counts, 10)
     
     # Top tracks
-    if "track_name" in recent.columns:
-        insights["top_tracks"] = recent["track_name"].value_counts().head(10).to_dict()
+    if track_counts is not None:
+        insights["top_tracks"] = _top_counts(track_counts[track_counts.index.notna()], 10)
     
     # Listening hours
-    if "ms_played" in recent.columns:
-        total_ms = recent["ms_played"].sum()
+    if total_ms is not None:
         insights["listening_hours"] = round(total_ms / (1000 * 60 * 60), 1)
     
     # Peak hours
-    if "timestamp" in recent.columns:
-        recent["hour"] = pd.to_datetime(recent["timestamp"]).dt.hour
-        insights["peak_hours"] = recent["hour"].value_counts().head(5).to_dict()
+    if hour_counts is not None:
+        insights["peak_hours"] = hour_counts.head(5).to_dict()
     
     # Discovery rate (tracks played for first time)
-    if "track_name" in recent.columns:
-        first_plays = recent.drop_duplicates(subset=["track_name"], keep="first")
-        insights["discovery_rate"] = len(first_plays) / len(recent) if len(recent) > 0 else 0
+    if track_counts is not None:
+        first_plays = int((track_counts > 0).sum())
+        insights["discovery_rate"] = first_plays / recent_rows
     
     return insights
 
@@ -142,7 +388,9 @@ def suggest_playlist_merge_candidates(
     playlists_df: pd.DataFrame,
     playlist_tracks_df: pd.DataFrame,
     similarity_threshold: float = 0.5,
-    size_threshold: int = 20
+    size_threshold: int = 20,
+    track_index: Optional[Dict[str, frozenset]] = None,
+    approximate: bool = False
 ) -> List[Dict[str, any]]:
     """
     Suggest playlists that could be merged based on similarity.
@@ -150,6 +398,8 @@ def suggest_playlist_merge_candidates(
     Args:
         similarity_threshold: Minimum similarity to suggest merge
         size_threshold: Minimum playlist size to consider
+        track_index: Prebuilt index from build_playlist_track_index (optional)
+        approximate: Allow MinHash LSH candidate search on large libraries (may miss pairs)
     
     Returns:
         List of merge suggestions with details
@@ -163,66 +413,74 @@ def suggest_playlist_merge_candidates(
         else playlists_df.copy()
     )
     
-    # Build track sets
+    if track_index is None:
+        track_index = build_playlist_track_index(playlist_tracks_df)
     playlist_tracks = {}
-    for _, row in owned.iterrows():
-        playlist_id = row["playlist_id"]
-        tracks = playlist_tracks_df[playlist_tracks_df["playlist_id"] == playlist_id]
-        track_set = set(tracks["track_id"].unique())
+    for playlist_id, name in owned[["playlist_id", "name"]].itertuples(index=False, name=None):
+        track_set = track_index.get(playlist_id, frozenset())
         if len(track_set) >= size_threshold:
             playlist_tracks[playlist_id] = {
-                "name": row["name"],
+                "name": name,
                 "tracks": track_set,
                 "size": len(track_set)
             }
     
     # Find similar pairs
-    playlist_ids = list(playlist_tracks.keys())
-    for i, pid1 in enumerate(playlist_ids):
-        for pid2 in playlist_ids[i+1:]:
-            pl1 = playlist_tracks[pid1]
-            pl2 = playlist_tracks[pid2]
-            
-            similarity = calculate_playlist_similarity(pl1["tracks"], pl2["tracks"])
-            
-            if similarity >= similarity_threshold:
-                # Calculate merge benefits
-                unique_tracks = len(pl1["tracks"] | pl2["tracks"])
-                overlap = len(pl1["tracks"] & pl2["tracks"])
-                
-                suggestions.append({
-                    "playlist1": pl1["name"],
-                    "playlist2": pl2["name"],
-                    "similarity": round(similarity, 2),
-                    "overlap": overlap,
-                    "unique_tracks": unique_tracks,
-                    "size1": pl1["size"],
-                    "size2": pl2["size"],
-                    "merge_benefit": f"Would combine {pl1['size']} + {pl2['size']} = {unique_tracks} unique tracks"
-                })
+    track_sets = {pid: pl["tracks"] for pid, pl in playlist_tracks.items()}
+    for pid1, pid2, similarity in _jaccard_pairs(track_sets, similarity_threshold, approximate):
+        pl1 = playlist_tracks[pid1]
+        pl2 = playlist_tracks[pid2]
+        
+        # Calculate merge benefits
+        unique_tracks = len(pl1["tracks"] | pl2["tracks"])
+        overlap = len(pl1["tracks"] & pl2["tracks"])
+        
+        suggestions.append({
+            "playlist1": pl1["name"],
+            "playlist2": pl2["name"],
+            "similarity": round(similarity, 2),
+            "overlap": overlap,
+            "unique_tracks": unique_tracks,
+            "size1": pl1["size"],
+            "size2": pl2["size"],
+            "merge_benefit": f"Would combine {pl1['size']} + {pl2['size']} = {unique_tracks} unique tracks"
+        })
     
     # Sort by similarity
     suggestions.sort(key=lambda x: x["similarity"], reverse=True)
     return suggestions
 
 
+# Report section separators
+SEP = "=" * 70
+RULE = "-" * 70
+
+
 def generate_listening_insights_report(
     playlists_df: pd.DataFrame,
     playlist_tracks_df: pd.DataFrame,
     tracks_df: pd.DataFrame,
-    streaming_history_df: Optional[pd.DataFrame] = None
+    streaming_history_df: Optional[Union[pd.DataFrame, Iterable[pd.DataFrame]]] = None
 ) -> str:
     """
     Generate a creative, formatted insights report.
     
+    streaming_history_df may also be an iterable of DataFrame batches, which
+    analyze_listening_patterns aggregates one batch at a time.
+    
     Returns:
         Formatted report string
     """
-    report_lines = []
-    report_lines.append("=" * 70)
-    report_lines.append("🎵 SPOTIM8 LISTENING INSIGHTS REPORT")
-    report_lines.append("=" * 70)
-    report_lines.append("")
+    buf = io.StringIO()
+    
+    def line(text: str = "") -> None:
+        buf.write(text)
+        buf.write("\n")
+    
+    line(SEP)
+    line("🎵 SPOTIM8 LISTENING INSIGHTS REPORT")
+    line(SEP)
+    line()
     
     # Library statistics
     total_playlists = (
@@ -233,88 +491,95 @@ def generate_listening_insights_report(
     total_tracks = len(playlist_tracks_df)
     unique_tracks = playlist_tracks_df["track_id"].nunique()
     
-    report_lines.append("📊 LIBRARY OVERVIEW")
-    report_lines.append("-" * 70)
-    report_lines.append(f"   🎵 Total Playlists: {total_playlists:,}")
-    report_lines.append(f"   🎶 Total Track Entries: {total_tracks:,}")
-    report_lines.append(f"   🎧 Unique Tracks: {unique_tracks:,}")
-    report_lines.append("")
+    line("📊 LIBRARY OVERVIEW")
+    line(RULE)
+    line(f"   🎵 Total Playlists: {total_playlists:,}")
+    line(f"   🎶 Total Track Entries: {total_tracks:,}")
+    line(f"   🎧 Unique Tracks: {unique_tracks:,}")
+    line()
     
     # Genre distribution
     if "genres" in tracks_df.columns:
-        all_genres = []
-        for genres_list in tracks_df["genres"].dropna():
-            if isinstance(genres_list, list):
-                all_genres.extend(genres_list)
+        # Flatten genre lists (lists or arrays from parquet) and count in one vectorized pass
+        all_genres = tracks_df["genres"].dropna().explode().dropna()
         
-        if all_genres:
-            genre_counts = Counter(all_genres)
-            top_genres = genre_counts.most_common(10)
+        if not all_genres.empty:
+            total_genres = all_genres.size
+            top_genres = all_genres.value_counts().head(10)
             
-            report_lines.append("🎸 TOP GENRES")
-            report_lines.append("-" * 70)
-            for genre, count in top_genres:
-                percentage = (count / len(all_genres)) * 100
+            line("🎸 TOP GENRES")
+            line(RULE)
+            for genre, count in top_genres.items():
+                percentage = (count / total_genres) * 100
                 bar_length = int(percentage / 2)  # Scale to 50 chars max
                 bar = "█" * bar_length
-                report_lines.append(f"   {genre:20s} {bar} {count:4d} ({percentage:5.1f}%)")
-            report_lines.append("")
+                line(f"   {genre:20s} {bar} {count:4d} ({percentage:5.1f}%)")
+            line()
     
     # Listening patterns (if streaming history available)
-    if streaming_history_df is not None and not streaming_history_df.empty:
+    if streaming_history_df is not None and not getattr(streaming_history_df, "empty", False):
         patterns = analyze_listening_patterns(streaming_history_df, days=30)
         
         if patterns:
-            report_lines.append("📈 RECENT LISTENING PATTERNS (Last 30 Days)")
-            report_lines.append("-" * 70)
+            line("📈 RECENT LISTENING PATTERNS (Last 30 Days)")
+            line(RULE)
             
             if "listening_hours" in patterns:
-                report_lines.append(f"   ⏱️  Total Listening Time: {patterns['listening_hours']} hours")
+                line(f"   ⏱️  Total Listening Time: {patterns['listening_hours']} hours")
             
             if "top_artists" in patterns:
-                report_lines.append(f"   🎤 Top Artist: {list(patterns['top_artists'].keys())[0]}")
+                line(f"   🎤 Top Artist: {list(patterns['top_artists'].keys())[0]}")
             
             if "discovery_rate" in patterns:
                 rate = patterns["discovery_rate"] * 100
-                report_lines.append(f"   🔍 Discovery Rate: {rate:.1f}% new tracks")
+                line(f"   🔍 Discovery Rate: {rate:.1f}% new tracks")
             
             if "peak_hours" in patterns:
                 peak_hour = max(patterns["peak_hours"].items(), key=lambda x: x[1])[0]
-                report_lines.append(f"   ⏰ Peak Listening Hour: {peak_hour}:00")
+                line(f"   ⏰ Peak Listening Hour: {peak_hour}:00")
             
-            report_lines.append("")
+            line()
     
-    # Playlist similarity insights
-    similar = find_similar_playlists(playlists_df, playlist_tracks_df, threshold=0.3)
+    # Playlist similarity insights (both passes share one track index)
+    track_index = build_playlist_track_index(playlist_tracks_df)
+    similar = find_similar_playlists(
+        playlists_df, playlist_tracks_df, threshold=0.3, track_index=track_index
+    )
     if similar:
-        report_lines.append("🔗 SIMILAR PLAYLISTS")
-        report_lines.append("-" * 70)
+        line("🔗 SIMILAR PLAYLISTS")
+        line(RULE)
         for name1, name2, sim in similar[:5]:  # Top 5
             sim_pct = sim * 100
-            report_lines.append(f"   {name1[:30]:30s} ↔ {name2[:30]:30s} ({sim_pct:.0f}% similar)")
-        report_lines.append("")
+            line(f"   {name1[:30]:30s} ↔ {name2[:30]:30s} ({sim_pct:.0f}% similar)")
+        line()
     
     # Merge suggestions
     merge_candidates = suggest_playlist_merge_candidates(
-        playlists_df, playlist_tracks_df, similarity_threshold=0.5
+        playlists_df, playlist_tracks_df, similarity_threshold=0.5, track_index=track_index
     )
     if merge_candidates:
-        report_lines.append("💡 MERGE SUGGESTIONS")
-        report_lines.append("-" * 70)
+        line("💡 MERGE SUGGESTIONS")
+        line(RULE)
         for suggestion in merge_candidates[:3]:  # Top 3
-            report_lines.append(f"   • {suggestion['playlist1']} + {suggestion['playlist2']}")
-            report_lines.append(f"     Similarity: {suggestion['similarity']*100:.0f}% | {suggestion['merge_benefit']}")
-        report_lines.append("")
+            line(f"   • {suggestion['playlist1']} + {suggestion['playlist2']}")
+            line(f"     Similarity: {suggestion['similarity']*100:.0f}% | {suggestion['merge_benefit']}")
+        line()
     
-    report_lines.append("=" * 70)
+    buf.write(SEP)
     
-    return "\n".join(report_lines)
+    return buf.getvalue()
+
+
+def index_tracks_by_id(tracks_df: pd.DataFrame) -> pd.DataFrame:
+    """tracks_df indexed by track_id (first row per id) for repeated lookups."""
+    return tracks_df.drop_duplicates("track_id").set_index("track_id")
 
 
 def calculate_playlist_health_score(
     playlist_id: str,
     playlist_tracks_df: pd.DataFrame,
-    tracks_df: pd.DataFrame
+    tracks_df: pd.DataFrame,
+    tracks_indexed: Optional[pd.DataFrame] = None
 ) -> Dict[str, any]:
     """
     Calculate a health score for a playlist.
@@ -325,6 +590,10 @@ def calculate_playlist_health_score(
     - Metadata completeness
     - Duplicate tracks (penalty)
     
+    Args:
+        tracks_indexed: tracks_df from index_tracks_by_id; pass it when scoring many
+            playlists so the track_id index is built once
+    
     Returns:
         Dictionary with score (0-100) and breakdown
     """
@@ -348,20 +617,17 @@ def calculate_playlist_health_score(
         factors["good_size"] = track_count
     
     # Duplicates (penalty)
-    duplicates = tracks["track_id"].duplicated().sum()
+    duplicates = track_count - tracks["track_id"].nunique(dropna=False)
     if duplicates > 0:
         score -= min(duplicates * 2, 20)
         factors["duplicates"] = duplicates
     
     # Genre diversity (bonus)
-    merged = tracks.merge(tracks_df, on="track_id", how="left")
+    if tracks_indexed is None:
+        tracks_indexed = index_tracks_by_id(tracks_df)
+    merged = tracks_indexed.reindex(tracks["track_id"])
     if "genres" in merged.columns:
-        all_genres = []
-        for genres_list in merged["genres"].dropna():
-            if isinstance(genres_list, list):
-                all_genres.extend(genres_list)
-        
-        unique_genres = len(set(all_genres))
+        unique_genres = merged["genres"].dropna().explode().nunique()
         if unique_genres >= 5:
             score += min(unique_genres - 5, 10)
             factors["genre_diversity"] = unique_genres
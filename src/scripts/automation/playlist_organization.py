@@ -19,6 +19,15 @@ from .sync import DATA_DIR, api_call, log, verbose_log, get_existing_playlists,
 from .playlist_aesthetics import check_playlist_health, get_playlist_statistics
 
 
+def _iter_id_name(playlists_df: pd.DataFrame, default_name: str):
+    """Yield (playlist_id, name) per row as plain tuples (no per-row Series)."""
+    columns = list(playlists_df.columns)
+    id_idx = columns.index("playlist_id")
+    name_idx = columns.index("name") if "name" in columns else None
+    for row in playlists_df.itertuples(index=False, name=None):
+        yield row[id_idx], (row[name_idx] if name_idx is not None else default_name)
+
+
 def categorize_playlists(playlists_df: pd.DataFrame) -> Dict[str, List[str]]:
     """
     Categorize playlists into logical groups.
@@ -43,9 +52,8 @@ def categorize_playlists(playlists_df: pd.DataFrame) -> Dict[str, List[str]]:
         "time_based": []
     }
     
-    for _, playlist in playlists_df.iterrows():
-        name = playlist.get("name", "").lower()
-        playlist_id = playlist["playlist_id"]
+    for playlist_id, name in _iter_id_name(playlists_df, ""):
+        name = name.lower()
         
         # Check for automated playlists (monthly, yearly patterns)
         if any(keyword in name for keyword in ["finds", "top", "discovery", "dscvr", "fnds"]):
@@ -104,11 +112,10 @@ def find_empty_playlists(
         List of (playlist_id, playlist_name) tuples
     """
     empty = []
-    for _, playlist in playlists_df.iterrows():
-        playlist_id = playlist["playlist_id"]
+    for playlist_id, name in _iter_id_name(playlists_df, "Unknown"):
         tracks = playlist_tracks_df[playlist_tracks_df["playlist_id"] == playlist_id]
         if tracks.empty:
-            empty.append((playlist_id, playlist.get("name", "Unknown")))
+            empty.append((playlist_id, name))
     return empty
 
 
@@ -129,15 +136,14 @@ def find_stale_playlists(
     stale = []
     cutoff_date = pd.Timestamp.now("UTC") - timedelta(days=days_threshold)
 
-    for _, playlist in playlists_df.iterrows():
-        playlist_id = playlist["playlist_id"]
+    for playlist_id, name in _iter_id_name(playlists_df, "Unknown"):
         tracks = playlist_tracks_df[playlist_tracks_df["playlist_id"] == playlist_id]
 
         if not tracks.empty and "added_at" in tracks.columns:
             latest = pd.to_datetime(tracks["added_at"], utc=True).max()
             if latest < cutoff_date:
                 days_ago = (pd.Timestamp.now("UTC") - latest).days
-                stale.append((playlist_id, playlist.get("name", "Unknown"), days_ago))
+                stale.append((playlist_id, name, days_ago))
     
     return stale
 
@@ -160,13 +166,11 @@ def get_playlist_organization_report(
     # Count duplicates across all playlists
     total_duplicates = 0
     playlists_with_duplicates = []
-    for _, playlist in playlists_df.iterrows():
-        duplicates = find_duplicate_tracks_in_playlist(
-            playlist_tracks_df, playlist["playlist_id"]
-        )
+    for playlist_id, name in zip(playlists_df["playlist_id"], playlists_df["name"]):
+        duplicates = find_duplicate_tracks_in_playlist(playlist_tracks_df, playlist_id)
         if duplicates:
             total_duplicates += len(duplicates)
-            playlists_with_duplicates.append(playlist["name"])
+            playlists_with_duplicates.append(name)
     
     # Calculate statistics
     total_playlists = len(playlists_df)
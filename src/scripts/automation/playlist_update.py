@@ -7,16 +7,202 @@ This module is extracted from sync.py and uses late imports to access
 utilities from sync.py to avoid circular dependencies.
 """
 
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 import spotipy
+import numpy as np
 import pandas as pd
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
 
 from .formatting import format_playlist_name, format_playlist_description
 from .error_handling import handle_errors
+from .config import PARALLEL_MAX_WORKERS
+
+# Spotify accepts up to 100 URIs per playlist_add_items request
+PLAYLIST_ADD_CHUNK_SIZE = 100
+
+_ADDED_AT_COLUMNS = ("added_at", "playlist_added_at", "track_added_at")
+_TIME_COLUMNS = ("timestamp", "endTime")
+
+
+def _parse_utc(values: pd.Series) -> pd.Series:
+    """Parse ISO-8601 timestamps (Spotify's added_at / history format) to UTC datetimes.
+    
+    An explicit format keeps pandas on its vectorized parser instead of inferring
+    per element; pandas < 2.0 does not accept "ISO8601" and falls back to inference.
+    """
+    try:
+        return pd.to_datetime(values, errors="coerce", utc=True, cache=True, format="ISO8601")
+    except (TypeError, ValueError):
+        return pd.to_datetime(values, errors="coerce", utc=True, cache=True)
+
+
+def _iter_liked_songs(playlist_tracks_path, liked_playlist_id: str, batch_size: int = 65_536):
+    """Yield the liked-songs rows of playlist_tracks.parquet in record batches.
+    
+    With pyarrow the dataset schema is probed first so only playlist_id, the added-at
+    column and track_uri/track_id are decoded, the playlist_id filter is pushed down
+    to the scan, and peak memory scales with batch_size. Without pyarrow the full
+    file is read and masked into a single batch.
+    """
+    try:
+        import pyarrow.dataset as pads
+    except ImportError:
+        library = pd.read_parquet(playlist_tracks_path)
+        liked = library[library["playlist_id"].astype(str) == liked_playlist_id]
+        if not liked.empty:
+            yield liked
+        return
+    
+    dataset = pads.dataset(playlist_tracks_path, format="parquet")
+    available = set(dataset.schema.names)
+    columns = ["playlist_id"]
+    columns += [col for col in _ADDED_AT_COLUMNS if col in available][:1]
+    columns += [col for col in ("track_uri", "track_id") if col in available][:1]
+    batches = dataset.to_batches(
+        columns=columns,
+        filter=pads.field("playlist_id") == str(liked_playlist_id),
+        batch_size=batch_size,
+    )
+    for batch in batches:
+        if batch.num_rows:
+            yield batch.to_pandas()
+
+
+# (path, mtime_ns, liked_playlist_id) -> (liked row count, {month: [uri, ...]}); a rewritten
+# parquet has a new mtime, so stale entries are never hit
+_LIKED_CACHE = {}
+
+
+def _load_liked_by_month(playlist_tracks_path, liked_playlist_id: str) -> tuple:
+    """Liked-song URIs grouped by YYYY-MM month, deduped in first-added order.
+    
+    Returns (liked row count, {month: [uri, ...]}). The result is cached on the file's
+    mtime, so repeated calls in one process skip the parquet scan until it changes.
+    """
+    from .sync import _to_uri_series
+    
+    key = (str(playlist_tracks_path), playlist_tracks_path.stat().st_mtime_ns, liked_playlist_id)
+    cached = _LIKED_CACHE.get(key)
+    if cached is not None:
+        return cached
+    
+    # Stream liked songs batch by batch; batches arrive in file order, so extending
+    # per-month lists keeps first-added order and dict.fromkeys dedups at the end
+    month_uris = defaultdict(list)
+    liked_rows = 0
+    for liked in _iter_liked_songs(playlist_tracks_path, liked_playlist_id):
+        liked_rows += len(liked)
+        columns = set(liked.columns)
+        added_col = next((col for col in _ADDED_AT_COLUMNS if col in columns), None)
+        if not added_col:
+            continue
+
+        # Parse timestamps
+        added = _parse_utc(liked[added_col])
+        # Handle both track_uri and track_id columns
+        uris = liked["track_uri"] if "track_uri" in columns else _to_uri_series(liked["track_id"])
+        batch = pd.DataFrame({
+            "month": added.values.astype("datetime64[M]").astype(str),
+            "_uri": uris.to_numpy(),
+        }).dropna(subset=["_uri"]).drop_duplicates(keep="first")
+        for month, batch_uris in batch.groupby("month", sort=False)["_uri"].agg(list).items():
+            month_uris[month].extend(batch_uris)
+    
+    result = (liked_rows, {month: list(dict.fromkeys(uris)) for month, uris in month_uris.items()})
+    _LIKED_CACHE.clear()  # only the latest file version is worth keeping
+    _LIKED_CACHE[key] = result
+    return result
+
+
+def _process_month(
+    sp: spotipy.Spotify,
+    month: str,
+    existing: dict,
+    user_id: str,
+    playlist_configs: list,
+) -> tuple:
+    """Create or update one month's playlists; returns (month, {playlist_type: track_uris}, created_any).
+    
+    New playlists are recorded in the shared existing dict; the caller invalidates the
+    playlist cache once after all months when created_any is set.
+    """
+    from .sync import (
+        log, verbose_log, get_playlist_tracks, api_call, _chunked,
+        _update_playlist_description_with_genres, evict_playlist_tracks,
+    )
+    tracks_by_type = {}
+    created_any = False
+    
+    for playlist_type, template, description, get_tracks_fn in playlist_configs:
+        # Get tracks for this playlist type and month (may be empty for new month)
+        track_uris = get_tracks_fn(month) or []
+        tracks_by_type[playlist_type] = track_uris
+
+        # Format playlist name (all types use monthly format for monthly playlists)
+        name = format_playlist_name(template, month, playlist_type=playlist_type)
+
+        # Create or update even when empty so new month gets a playlist on rollover (e.g. AJFndsFeb26 on 1 Feb)
+        pid = existing.get(name)
+        if pid is not None:
+            if not track_uris:
+                # Nothing to add (e.g. first day of a new month): skip fetching the playlist
+                log(f"  {name}: up to date (0 tracks)")
+                _update_playlist_description_with_genres(sp, user_id, pid, track_uris)
+                continue
+            already = get_playlist_tracks(sp, pid)  # frozenset: hashed membership
+            to_add = [u for u in track_uris if u not in already]
+
+            if to_add:
+                for chunk in _chunked(to_add, PLAYLIST_ADD_CHUNK_SIZE):
+                    api_call(sp.playlist_add_items, pid, chunk)
+                evict_playlist_tracks(pid)
+                log(f"  {name}: +{len(to_add)} tracks ({len(track_uris)} total)")
+            else:
+                log(f"  {name}: up to date ({len(track_uris)} tracks)")
+            # Update description with genre tags (even if 0 tracks)
+            _update_playlist_description_with_genres(sp, user_id, pid, track_uris)
+        else:
+            # Create playlist (may be empty for first day of new month)
+            verbose_log(f"Creating new playlist '{name}' for {month} (type={playlist_type})...")
+            pl = api_call(
+                sp.user_playlist_create,
+                user_id,
+                name,
+                public=False,
+                description=format_playlist_description(description, period=month, playlist_type=playlist_type),
+            )
+            pid = pl["id"]
+            verbose_log(f"  Created playlist '{name}' with id {pid}")
+
+            # Add tracks
+            verbose_log(f"  Adding {len(track_uris)} tracks in chunks...")
+            chunk_count = 0
+            for chunk in _chunked(track_uris, PLAYLIST_ADD_CHUNK_SIZE):
+                chunk_count += 1
+                verbose_log(f"    Adding chunk {chunk_count} ({len(chunk)} tracks)...")
+                api_call(sp.playlist_add_items, pid, chunk)
+
+            # Update description with genre tags
+            _update_playlist_description_with_genres(sp, user_id, pid, track_uris)
+
+            # Each month writes distinct names; a single dict store is atomic under the GIL
+            existing[name] = pid
+            created_any = True
+            log(f"  {name}: created with {len(track_uris)} tracks")
+    
+    return month, tracks_by_type, created_any
+
 
 @handle_errors(reraise=False, default_return={}, log_error=True)
-def update_monthly_playlists(sp: spotipy.Spotify, keep_last_n_months: int = 3) -> dict:
+def update_monthly_playlists(
+    sp: spotipy.Spotify,
+    existing: dict = None,
+    user: dict = None,
+    keep_last_n_months: int = 3,
+) -> dict:
     """Update monthly playlists for the last N months by calendar (including current month).
     
     Uses calendar-based "last N months" so when a new month starts (e.g. 1 Feb), the new
@@ -32,6 +218,8 @@ def update_monthly_playlists(sp: spotipy.Spotify, keep_last_n_months: int = 3) -
       - Missing history results in empty playlists for those types
     
     Args:
+        existing: {name: id} of the user's playlists, if already fetched this run
+        user: Current user info, if already fetched this run
         keep_last_n_months: Number of recent months to keep as monthly playlists (default: 3)
     
     Note: This function only ADDS tracks to playlists. It never removes tracks.
@@ -40,8 +228,8 @@ def update_monthly_playlists(sp: spotipy.Spotify, keep_last_n_months: int = 3) -
     # Late imports from sync.py
     from .sync import (
         log, verbose_log, DATA_DIR, ENABLE_MONTHLY, ENABLE_MOST_PLAYED, ENABLE_DISCOVERY,
-        LIKED_SONGS_PLAYLIST_ID, MONTHLY_NAME_TEMPLATE, get_existing_playlists, get_user_info, get_playlist_tracks, api_call,
-        _chunked, _update_playlist_description_with_genres, _playlist_tracks_cache, _invalidate_playlist_cache
+        LIKED_SONGS_PLAYLIST_ID, MONTHLY_NAME_TEMPLATE, get_existing_playlists, get_user_info,
+        _invalidate_playlist_cache,
     )
     log(f"\n--- Monthly Playlists (Last {keep_last_n_months} Months Only) ---")
     
@@ -71,18 +259,23 @@ def update_monthly_playlists(sp: spotipy.Spotify, keep_last_n_months: int = 3) -
     # NOTE: Streaming history comes from periodic Spotify exports and may lag behind API data.
     # API data (liked songs) is always more up-to-date than streaming history exports.
     # If streaming history is missing or incomplete, these playlist types will be empty or incomplete.
-    from src.analysis.streaming_history import load_streaming_history
+    from src.analysis.streaming_history import load_streaming_history, get_streaming_history_max_timestamp
     history_df = load_streaming_history(DATA_DIR)
     if history_df is not None and not history_df.empty:
-        # Ensure timestamp is datetime
+        # Ensure timestamp is datetime (skip the parse when it already is)
         if 'timestamp' in history_df.columns:
-            history_df['timestamp'] = pd.to_datetime(history_df['timestamp'], errors='coerce', utc=True)
+            ts = history_df['timestamp']
+            if not pd.api.types.is_datetime64_any_dtype(ts):
+                history_df['timestamp'] = _parse_utc(ts)
         
         # Check data freshness - warn if streaming history is significantly behind
         # Streaming history comes from periodic exports, so it may lag behind API data
         if 'timestamp' in history_df.columns:
             try:
-                latest_history = history_df['timestamp'].max()
+                # Row-group statistics give the max without scanning the column
+                latest_history = get_streaming_history_max_timestamp(DATA_DIR)
+                if latest_history is None:
+                    latest_history = history_df['timestamp'].max()
                 if pd.notna(latest_history):
                     # Convert to naive datetime for comparison if needed
                     if latest_history.tzinfo:
@@ -110,34 +303,12 @@ def update_monthly_playlists(sp: spotipy.Spotify, keep_last_n_months: int = 3) -
     all_month_to_tracks = {}
     
     if playlist_tracks_path.exists():
-        library = pd.read_parquet(playlist_tracks_path)
-        liked = library[library["playlist_id"].astype(str) == LIKED_SONGS_PLAYLIST_ID].copy()
+        liked_rows, month_uris = _load_liked_by_month(playlist_tracks_path, LIKED_SONGS_PLAYLIST_ID)
         
-        if not liked.empty:
-            # Parse timestamps
-            added_col = None
-            for col in ["added_at", "playlist_added_at", "track_added_at"]:
-                if col in liked.columns:
-                    added_col = col
-                    break
-            
-            if added_col:
-                liked[added_col] = pd.to_datetime(liked[added_col], errors="coerce", utc=True)
-                liked["month"] = liked[added_col].dt.to_period("M").astype(str)
-                
-                # Handle both track_uri and track_id columns
-                if "track_uri" in liked.columns:
-                    liked["_uri"] = liked["track_uri"]
-                else:
-                    liked["_uri"] = liked["track_id"].map(_to_uri)
-                
-                # Build month -> tracks mapping for "Finds" playlists (API data only)
-                for month, group in liked.groupby("month"):
-                    uris = group["_uri"].dropna().tolist()
-                    seen = set()
-                    unique = [u for u in uris if not (u in seen or seen.add(u))]
-                    all_month_to_tracks[month] = {"monthly": unique}
-                
+        if liked_rows:
+            # Build month -> tracks mapping for "Finds" playlists (API data only)
+            all_month_to_tracks = {month: {"monthly": uris} for month, uris in month_uris.items()}
+            if all_month_to_tracks:
                 log(f"  Loaded liked songs (API data) for 'Finds' playlists: {len(all_month_to_tracks)} month(s)")
         else:
             log("  ⚠️  No liked songs found in library data - 'Finds' playlists will be empty")
@@ -150,8 +321,9 @@ def update_monthly_playlists(sp: spotipy.Spotify, keep_last_n_months: int = 3) -
     # Get months for other playlist types (streaming history)
     history_months = set()
     if history_df is not None and not history_df.empty:
-        history_df['month'] = history_df['timestamp'].dt.to_period('M').astype(str)
-        history_months = set(history_df['month'].unique())
+        # Truncate to months on the raw datetime64 buffer and only stringify the unique values
+        months = np.unique(history_df['timestamp'].values.astype('datetime64[M]'))
+        history_months = {str(m) for m in months}
     
     # Last N months by calendar (always include current month so new month gets a playlist on rollover)
     # Example: on 1 Feb 2026 with N=3 -> [2025-12, 2026-01, 2026-02]; create AJFndsFeb26, AJFndsJan26, AJFndsDec25
@@ -159,7 +331,7 @@ def update_monthly_playlists(sp: spotipy.Spotify, keep_last_n_months: int = 3) -
     calendar_last_n = [(now - relativedelta(months=i)).strftime("%Y-%m") for i in range(keep_last_n_months)]
     recent_months = sorted(set(calendar_last_n))
     all_months = finds_months | history_months
-    older_months = [m for m in sorted(all_months) if m not in recent_months] if all_months else []
+    older_months = sorted(all_months - set(recent_months)) if all_months else []
     if older_months:
         log(f"📅 Keeping last {keep_last_n_months} months (by calendar) as monthly: {', '.join(recent_months)}")
         log(f"📦 Older months will be merged into yearly playlists then removed: {', '.join(older_months[:10])}{'…' if len(older_months) > 10 else ''}")
@@ -173,9 +345,11 @@ def update_monthly_playlists(sp: spotipy.Spotify, keep_last_n_months: int = 3) -
     
     log(f"Processing {len(recent_months)} month(s) for all playlist types...")
     
-    # Get existing playlists (cached)
-    existing = get_existing_playlists(sp)
-    user = get_user_info(sp)
+    # Get existing playlists (cached) unless the caller already has them
+    if existing is None:
+        existing = get_existing_playlists(sp)
+    if user is None:
+        user = get_user_info(sp)
     user_id = user["id"]
     
     # Define playlist types and their configurations
@@ -199,75 +373,35 @@ def update_monthly_playlists(sp: spotipy.Spotify, keep_last_n_months: int = 3) -
         log("⚠️  All playlist types are disabled in .env file. No playlists will be created.")
         return {}
     
+    # Months map to different playlists and the work is API-latency bound, so run them
+    # concurrently; results are reassembled in month order
     month_to_tracks = {}
+    created_any = False
+    with ThreadPoolExecutor(max_workers=min(PARALLEL_MAX_WORKERS, len(recent_months))) as executor:
+        futures = [
+            executor.submit(_process_month, sp, month, existing, user_id, playlist_configs)
+            for month in recent_months
+        ]
+        for future in as_completed(futures):
+            month, tracks_by_type, created = future.result()
+            month_to_tracks[month] = tracks_by_type
+            created_any = created_any or created
     
-    for month in sorted(recent_months):
-        month_to_tracks[month] = {}
-        
-        for playlist_type, template, description, get_tracks_fn in playlist_configs:
-            # Get tracks for this playlist type and month (may be empty for new month)
-            track_uris = get_tracks_fn(month) or []
-            month_to_tracks[month][playlist_type] = track_uris
-            
-            # Format playlist name (all types use monthly format for monthly playlists)
-            name = format_playlist_name(template, month, playlist_type=playlist_type)
-            
-            # Create or update even when empty so new month gets a playlist on rollover (e.g. AJFndsFeb26 on 1 Feb)
-            if name in existing:
-                pid = existing[name]
-                already = get_playlist_tracks(sp, pid)
-                to_add = [u for u in track_uris if u not in already]
-                
-                if to_add:
-                    for chunk in _chunked(to_add, 50):
-                        api_call(sp.playlist_add_items, pid, chunk)
-                    if pid in _playlist_tracks_cache:
-                        del _playlist_tracks_cache[pid]
-                    log(f"  {name}: +{len(to_add)} tracks ({len(track_uris)} total)")
-                else:
-                    log(f"  {name}: up to date ({len(track_uris)} tracks)")
-                # Update description with genre tags (even if 0 tracks)
-                _update_playlist_description_with_genres(sp, user_id, pid, track_uris)
-            else:
-                # Create playlist (may be empty for first day of new month)
-                from calendar import monthrange
-                year, month_num = map(int, month.split("-"))
-                last_day = monthrange(year, month_num)[1]
-                created_at = datetime(year, month_num, last_day, 23, 59, 59)
-                
-                verbose_log(f"Creating new playlist '{name}' for {month} (type={playlist_type})...")
-                pl = api_call(
-                    sp.user_playlist_create,
-                    user_id,
-                    name,
-                    public=False,
-                    description=format_playlist_description(description, period=month, playlist_type=playlist_type),
-                )
-                pid = pl["id"]
-                verbose_log(f"  Created playlist '{name}' with id {pid}")
-                
-                # Add tracks
-                verbose_log(f"  Adding {len(track_uris)} tracks in chunks...")
-                chunk_count = 0
-                for chunk in _chunked(track_uris, 50):
-                    chunk_count += 1
-                    verbose_log(f"    Adding chunk {chunk_count} ({len(chunk)} tracks)...")
-                    api_call(sp.playlist_add_items, pid, chunk)
-                
-                # Update description with genre tags
-                _update_playlist_description_with_genres(sp, user_id, pid, track_uris)
-                
-                _invalidate_playlist_cache()
-                verbose_log(f"  Invalidated playlist cache after creating new playlist")
-                log(f"  {name}: created with {len(track_uris)} tracks")
+    if created_any:
+        # existing already holds the new playlists; drop the cache once for later steps
+        _invalidate_playlist_cache()
+        verbose_log("  Invalidated playlist cache after creating new playlists")
+    
+    month_to_tracks = {month: month_to_tracks[month] for month in recent_months}
     
     return month_to_tracks
 
 
 @handle_errors(reraise=False, default_return=None, log_error=True)
-def update_current_year_playlists(sp: spotipy.Spotify) -> None:
+def update_current_year_playlists(sp: spotipy.Spotify, existing: dict = None, user: dict = None) -> None:
     """Update the current year's yearly playlists (Finds, Top, Discovery) with new liked songs / most-played / discovery.
     Only adds tracks; never removes. Run after sync so library and history are up to date.
+    Pass existing ({name: id}) and/or user when the caller already fetched them this run.
     """
     from .sync import (
         log, verbose_log, DATA_DIR, ENABLE_MONTHLY, ENABLE_MOST_PLAYED, ENABLE_DISCOVERY,
@@ -280,23 +414,25 @@ def update_current_year_playlists(sp: spotipy.Spotify) -> None:
     log("\n--- Update Current Year Playlists (Finds, Top, Discovery) ---")
     current_year = datetime.now().year
     year_short = str(current_year)[2:]
-    existing = get_existing_playlists(sp)
-    user = get_user_info(sp)
+    if existing is None:
+        existing = get_existing_playlists(sp)
+    if user is None:
+        user = get_user_info(sp)
     user_id = user["id"]
+    created_any = False
 
     # Finds: add current liked songs to current year's yearly playlist
     if ENABLE_MONTHLY:
         finds_name = format_yearly_playlist_name(str(current_year))
-        if finds_name in existing:
-            pid = existing[finds_name]
+        pid = existing.get(finds_name)
+        if pid is not None:
             liked_uris = get_liked_song_uris(sp)
-            already = get_playlist_tracks(sp, pid)
+            already = get_playlist_tracks(sp, pid) if liked_uris else frozenset()
             to_add = [u for u in liked_uris if u and isinstance(u, str) and u not in already]
             if to_add:
-                for chunk in _chunked(to_add, 50):
-                    valid = [u for u in chunk if u and isinstance(u, str)]
-                    if valid:
-                        api_call(sp.playlist_add_items, pid, valid)
+                # to_add was validated above, so chunks go straight to the API
+                for chunk in _chunked(to_add, PLAYLIST_ADD_CHUNK_SIZE):
+                    api_call(sp.playlist_add_items, pid, chunk)
                 _invalidate_playlist_cache()
                 log(f"  {finds_name}: +{len(to_add)} tracks (total liked: {len(liked_uris)})")
             else:
@@ -313,86 +449,84 @@ def update_current_year_playlists(sp: spotipy.Spotify) -> None:
             )
             pid = pl["id"]
             valid_uris = [u for u in liked_uris if u and isinstance(u, str)]
-            for chunk in _chunked(valid_uris, 50):
-                if chunk:
-                    api_call(sp.playlist_add_items, pid, chunk)
+            for chunk in _chunked(valid_uris, PLAYLIST_ADD_CHUNK_SIZE):
+                api_call(sp.playlist_add_items, pid, chunk)
             _update_playlist_description_with_genres(sp, user_id, pid, liked_uris)
-            _invalidate_playlist_cache()
+            existing[finds_name] = pid
+            created_any = True
             log(f"  {finds_name}: created with {len(liked_uris)} tracks")
 
     # Top & Discovery: use streaming history for current year
     from src.analysis.streaming_history import load_streaming_history
-    from src.scripts.automation._sync_impl.history import get_most_played_tracks, get_discovery_tracks
+    from src.scripts.automation._sync_impl.history import get_top_and_discovery_tracks
     history_df = load_streaming_history(DATA_DIR)
     time_col = None
     if history_df is not None and not history_df.empty:
-        if "timestamp" in history_df.columns:
-            time_col = "timestamp"
-        elif "endTime" in history_df.columns:
-            time_col = "endTime"
+        columns = set(history_df.columns)
+        time_col = next((col for col in _TIME_COLUMNS if col in columns), None)
     if history_df is not None and not history_df.empty and time_col:
-        history_df = history_df.copy()
-        history_df["timestamp"] = pd.to_datetime(history_df[time_col], errors="coerce", utc=True)
-        history_df["year"] = history_df["timestamp"].dt.year
-        year_df = history_df[history_df["year"] == current_year]
+        # history_df was freshly loaded above, so it is safe to fill "timestamp" in place
+        timestamps = history_df[time_col]
+        if not pd.api.types.is_datetime64_any_dtype(timestamps):
+            timestamps = _parse_utc(timestamps)
+        history_df["timestamp"] = timestamps
+        year_df = history_df[history_df["timestamp"].dt.year == current_year]
         if not year_df.empty:
+            top_uris, disc_uris = get_top_and_discovery_tracks(year_df, limit=100)
             if ENABLE_MOST_PLAYED:
                 top_name = format_playlist_name(YEARLY_NAME_TEMPLATE, year=year_short, playlist_type="most_played")
-                top_uris = get_most_played_tracks(year_df, month_str=None, limit=100)
-                if top_name in existing and top_uris:
-                    pid = existing[top_name]
+                pid = existing.get(top_name)
+                if pid is not None and top_uris:
                     already = get_playlist_tracks(sp, pid)
                     to_add = [u for u in top_uris if u and isinstance(u, str) and u not in already]
                     if to_add:
-                        for chunk in _chunked(to_add, 50):
-                            valid = [u for u in chunk if u and isinstance(u, str)]
-                            if valid:
-                                api_call(sp.playlist_add_items, pid, valid)
+                        for chunk in _chunked(to_add, PLAYLIST_ADD_CHUNK_SIZE):
+                            api_call(sp.playlist_add_items, pid, chunk)
                         _invalidate_playlist_cache()
                         log(f"  {top_name}: +{len(to_add)} tracks")
                     else:
                         log(f"  {top_name}: up to date")
-                elif top_uris and top_name not in existing:
+                elif top_uris and pid is None:
                     pl = api_call(sp.user_playlist_create, user_id, top_name, public=False,
                         description=format_playlist_description("Most played", period=str(current_year), playlist_type="most_played"))
                     valid_top = [u for u in top_uris if u and isinstance(u, str)]
-                    for chunk in _chunked(valid_top, 50):
-                        if chunk:
-                            api_call(sp.playlist_add_items, pl["id"], chunk)
+                    for chunk in _chunked(valid_top, PLAYLIST_ADD_CHUNK_SIZE):
+                        api_call(sp.playlist_add_items, pl["id"], chunk)
                     _update_playlist_description_with_genres(sp, user_id, pl["id"], top_uris)
-                    _invalidate_playlist_cache()
+                    existing[top_name] = pl["id"]
+                    created_any = True
                     log(f"  {top_name}: created with {len(top_uris)} tracks")
             if ENABLE_DISCOVERY:
                 disc_name = format_playlist_name(YEARLY_NAME_TEMPLATE, year=year_short, playlist_type="discovery")
-                disc_uris = get_discovery_tracks(year_df, month_str=None, limit=100)
-                if disc_name in existing and disc_uris:
-                    pid = existing[disc_name]
+                pid = existing.get(disc_name)
+                if pid is not None and disc_uris:
                     already = get_playlist_tracks(sp, pid)
                     to_add = [u for u in disc_uris if u and isinstance(u, str) and u not in already]
                     if to_add:
-                        for chunk in _chunked(to_add, 50):
-                            valid = [u for u in chunk if u and isinstance(u, str)]
-                            if valid:
-                                api_call(sp.playlist_add_items, pid, valid)
+                        for chunk in _chunked(to_add, PLAYLIST_ADD_CHUNK_SIZE):
+                            api_call(sp.playlist_add_items, pid, chunk)
                         _invalidate_playlist_cache()
                         log(f"  {disc_name}: +{len(to_add)} tracks")
                     else:
                         log(f"  {disc_name}: up to date")
-                elif disc_uris and disc_name not in existing:
+                elif disc_uris and pid is None:
                     pl = api_call(sp.user_playlist_create, user_id, disc_name, public=False,
                         description=format_playlist_description("Discovery", period=str(current_year), playlist_type="discovery"))
                     valid_disc = [u for u in disc_uris if u and isinstance(u, str)]
-                    for chunk in _chunked(valid_disc, 50):
-                        if chunk:
-                            api_call(sp.playlist_add_items, pl["id"], chunk)
+                    for chunk in _chunked(valid_disc, PLAYLIST_ADD_CHUNK_SIZE):
+                        api_call(sp.playlist_add_items, pl["id"], chunk)
                     _update_playlist_description_with_genres(sp, user_id, pl["id"], disc_uris)
-                    _invalidate_playlist_cache()
+                    existing[disc_name] = pl["id"]
+                    created_any = True
                     log(f"  {disc_name}: created with {len(disc_uris)} tracks")
         else:
             log("  No streaming history for current year; skipping Top/Discovery update")
     else:
         log("  No streaming history; skipping Top/Discovery update")
 
+    if created_any:
+        _invalidate_playlist_cache()
+
 
 # ============================================================================
 # DUPLICATE PLAYLIST DETECTION & DELETION
@@ -27,7 +27,10 @@ Env: SPOTIPY_CLIENT_ID, SPOTIPY_CLIENT_SECRET; optional .env and --config FILE.
 import argparse
 import os
 import sys
+import traceback
 import warnings
+import weakref
+from functools import lru_cache
 from pathlib import Path
 
 warnings.filterwarnings("ignore", message=".*urllib3.*OpenSSL.*", category=UserWarning)
@@ -154,24 +157,31 @@ from src.scripts.automation._sync_impl import (
     timed_step,
     set_verbose,
     get_log_buffer,
+    set_log_buffering,
     api_call,
     get_spotify_client,
     _chunked,
     get_existing_playlists,
     get_playlist_tracks,
     get_liked_song_uris,
+    get_playlist_snapshots,
     get_user_info,
+    evict_playlist_tracks,
     _invalidate_playlist_cache,
     _playlist_tracks_cache,
     _to_uri,
+    _to_uri_series,
     _update_playlist_description_with_genres,
+    _update_all_playlist_descriptions,
     sync_full_library,
     sync_export_data,
+    _SYNC_STATE,
     rename_playlists_with_old_prefixes,
     get_most_played_tracks,
     get_time_based_tracks,
     get_repeat_tracks,
     get_discovery_tracks,
+    get_top_and_discovery_tracks,
 )
 
 # Re-export for backward compatibility
@@ -190,6 +200,216 @@ _data_dir_env = os.environ.get("SPOTIM8_DATA_DIR") or os.environ.get("DATA_DIR")
 # Workflow: sync_full_library, sync_export_data, rename_playlists_with_old_prefixes,
 # get_most_played_tracks, get_discovery_tracks, etc. from _sync_impl.
 
+
+_pd_mod = None
+
+
+def _pd():
+    """pandas, imported on first use by the parquet-reading steps."""
+    global _pd_mod
+    if _pd_mod is None:
+        import pandas
+        _pd_mod = pandas
+    return _pd_mod
+
+
+# Columns the descriptions / health_check / insights_report steps read from each file.
+# One projection per file (the union across steps) so the steps share a cached frame.
+STEP_PARQUET_COLUMNS = {
+    "playlists.parquet": ("playlist_id", "id", "name", "is_owned"),
+    "playlist_tracks.parquet": ("playlist_id", "track_id", "added_at"),
+    "tracks.parquet": ("track_id", "genres"),
+}
+
+
+def _read_parquet_uncached(path_str: str, columns: tuple = None):
+    """Read only the given columns (those present in the file); None reads everything.
+    Files are local, so they are memory-mapped rather than copied into read buffers."""
+    try:
+        import pyarrow.dataset as pads
+        from pyarrow import fs as pafs
+    except ImportError:
+        return _pd().read_parquet(path_str, columns=list(columns) if columns else None, memory_map=True)
+    dataset = pads.dataset(
+        str(Path(path_str).resolve()), format="parquet", filesystem=pafs.LocalFileSystem(use_mmap=True)
+    )
+    if columns is not None:
+        available = set(dataset.schema.names)
+        columns = [col for col in columns if col in available]
+    # self_destruct releases Arrow buffers as the pandas columns are built
+    return dataset.to_table(columns=columns).to_pandas(self_destruct=True)
+
+
+@lru_cache(maxsize=8)
+def _read_parquet_cached(path_str: str, mtime_ns: int, columns: tuple = None):
+    """Read a parquet file once per (path, mtime, columns); steps in one run share the frame (treat as read-only)."""
+    return _read_parquet_uncached(path_str, columns)
+
+
+def _read_parquet(path: Path, use_cache: bool = True):
+    """Read a data parquet file, projected to STEP_PARQUET_COLUMNS, reusing the frame
+    from an earlier step unless the file changed."""
+    columns = STEP_PARQUET_COLUMNS.get(path.name)
+    if not use_cache:
+        return _read_parquet_uncached(str(path), columns)
+    return _read_parquet_cached(str(path), path.stat().st_mtime_ns, columns)
+
+
+def _load_playlists(path: Path, use_cache: bool = True):
+    """Playlists table for the report steps: the frame the sync step loaded this run,
+    else playlists.parquet (e.g. with --skip-sync)."""
+    playlists_df = _SYNC_STATE.get("playlists_df")
+    if playlists_df is not None:
+        return playlists_df
+    return _read_parquet(path, use_cache=use_cache)
+
+
+# Last owned-playlists selection: (weakref to playlists_df, owned rows)
+_owned_cache = None
+
+
+def _owned_playlists(playlists_df):
+    """Rows with is_owned set (all rows if the column is missing). Reused while the
+    same cached playlists frame is passed in; the result is a read-only view."""
+    global _owned_cache
+    if _owned_cache is not None and _owned_cache[0]() is playlists_df:
+        return _owned_cache[1]
+    if "is_owned" not in playlists_df.columns:
+        owned = playlists_df
+    else:
+        owned = playlists_df.loc[playlists_df["is_owned"].to_numpy(dtype=bool, na_value=False)]
+    _owned_cache = (weakref.ref(playlists_df), owned)
+    return owned
+
+
+# Streaming history columns used by analyze_listening_patterns (the file grows with every export)
+STREAMING_HISTORY_COLUMNS = ("timestamp", "artist_name", "track_name", "ms_played")
+
+
+# ============================================================================
+# STEPS (one handler per --steps id; each receives sp, user, parsed args, summary)
+# ============================================================================
+
+
+def _step_sync(sp, user, args, summary: dict) -> None:
+    with timed_step("Full Library Sync"):
+        sync_success = sync_full_library(force=args.force)
+        summary["sync_completed"] = "Yes" if sync_success else "No"
+        verbose_log(f"Sync completed: success={sync_success}")
+
+
+def _step_rename(sp, user, args, summary: dict) -> None:
+    with timed_step("Rename Playlists with Old Prefixes"):
+        rename_playlists_with_old_prefixes(sp)
+
+
+def _step_delete_monthly_and_genre(sp, user, args, summary: dict) -> None:
+    with timed_step("Cleanup legacy automated playlists"):
+        delete_automated_monthly_and_genre_playlists(sp)
+
+
+def _step_consolidate(sp, user, args, summary: dict) -> None:
+    with timed_step("Ensure yearly archive playlists"):
+        consolidate_old_monthly_playlists(sp, keep_last_n_months=0)
+
+
+def _step_update_current_year(sp, user, args, summary: dict) -> None:
+    with timed_step("Update current year Finds, Top, Discovery"):
+        # user was fetched at login; playlists are re-read since earlier steps change them
+        update_current_year_playlists(sp, user=user)
+
+
+def _step_descriptions(sp, user, args, summary: dict) -> None:
+    with timed_step("Update playlist descriptions"):
+        try:
+            playlists_path = args.sync_data_dir / "playlists.parquet"
+            if "playlists_df" in _SYNC_STATE:
+                log("  Using playlists from this run's sync (in memory)")
+            elif playlists_path.exists():
+                log(f"  Using playlists from {playlists_path}")
+            else:
+                log(f"  playlists.parquet not found at {playlists_path}; skipping description updates")
+                return
+            playlists_df = _load_playlists(playlists_path, use_cache=not args.no_cache)
+            owned = _owned_playlists(playlists_df)
+            n_owned = len(owned)
+            log(f"  Updating descriptions for {n_owned} owned playlist(s)...")
+            # Only the id column is needed; avoid boxing every row into a Series
+            id_col = "playlist_id" if "playlist_id" in owned.columns else "id"
+            ids = owned[id_col].tolist() if id_col in owned.columns else []
+            # Live snapshot_ids (one request per page) let unchanged playlists skip the API entirely
+            snapshots = get_playlist_snapshots(sp)
+            n_updated = _update_all_playlist_descriptions(sp, user["id"], ids, snapshots=snapshots)
+            log(f"  Description updates complete ({n_owned} playlists processed, {n_updated} updated)")
+        except Exception as e:
+            log(f"  Update all descriptions failed (non-fatal): {e}")
+            verbose_log(f"  Exception: {type(e).__name__}: {e}")
+
+
+def _step_health_check(sp, user, args, summary: dict) -> None:
+    with timed_step("Playlist Health Check"):
+        try:
+            from .playlist_organization import get_playlist_organization_report, print_organization_report
+            use_cache = not args.no_cache
+            playlists_df = _load_playlists(DATA_DIR / "playlists.parquet", use_cache=use_cache)
+            playlist_tracks_df = _read_parquet(DATA_DIR / "playlist_tracks.parquet", use_cache=use_cache)
+            tracks_df = _read_parquet(DATA_DIR / "tracks.parquet", use_cache=use_cache)
+            # The organization report only reads its inputs, so no copy is needed
+            owned_playlists = _owned_playlists(playlists_df)
+            report = get_playlist_organization_report(
+                owned_playlists, playlist_tracks_df, tracks_df
+            )
+            print_organization_report(report)
+        except Exception as e:
+            verbose_log(f"  Health check failed (non-fatal): {e}")
+
+
+def _step_insights_report(sp, user, args, summary: dict) -> None:
+    with timed_step("Generating Insights Report"):
+        try:
+            from .playlist_intelligence import generate_listening_insights_report
+            from src.analysis.streaming_history import iter_streaming_history
+            use_cache = not args.no_cache
+            playlists_df = _load_playlists(DATA_DIR / "playlists.parquet", use_cache=use_cache)
+            playlist_tracks_df = _read_parquet(DATA_DIR / "playlist_tracks.parquet", use_cache=use_cache)
+            tracks_df = _read_parquet(DATA_DIR / "tracks.parquet", use_cache=use_cache)
+            streaming_history = None
+            if (DATA_DIR / "streaming_history.parquet").exists():
+                # Row batches: the report only keeps running counts of the history
+                streaming_history = iter_streaming_history(DATA_DIR, list(STREAMING_HISTORY_COLUMNS))
+            report = generate_listening_insights_report(
+                playlists_df, playlist_tracks_df, tracks_df, streaming_history
+            )
+            log("\n" + report)
+        except Exception as e:
+            verbose_log(f"  Insights report failed (non-fatal): {e}")
+
+
+# Banner logged before each step
+STEP_BANNERS = {
+    "sync": ">>> STEP: DATA SYNC <<<",
+    "rename": ">>> STEP: RENAME PLAYLISTS <<<",
+    "delete_monthly_and_genre": ">>> STEP: CLEANUP LEGACY PLAYLISTS <<<",
+    "consolidate": ">>> STEP: ENSURE YEARLY ARCHIVE PLAYLISTS <<<",
+    "update_current_year": ">>> STEP: UPDATE CURRENT YEAR <<<",
+    "descriptions": ">>> STEP: PLAYLIST DESCRIPTIONS <<<",
+    "health_check": ">>> STEP: HEALTH CHECK <<<",
+    "insights_report": ">>> STEP: INSIGHTS REPORT <<<",
+}
+
+# Step id -> handler; keys must match SYNC_STEP_IDS in sync_options.py
+STEPS = {
+    "sync": _step_sync,
+    "rename": _step_rename,
+    "delete_monthly_and_genre": _step_delete_monthly_and_genre,
+    "consolidate": _step_consolidate,
+    "update_current_year": _step_update_current_year,
+    "descriptions": _step_descriptions,
+    "health_check": _step_health_check,
+    "insights_report": _step_insights_report,
+}
+
+
 def main():
     # Load environment variables from .env file if available
     if DOTENV_AVAILABLE:
@@ -223,13 +443,18 @@ Examples:
     _config.reload_from_env()
 
     set_verbose(args.verbose)
+    # Decide once (after --config/CLI env overrides) whether log lines are kept for the email;
+    # when email is off, log() only prints
+    set_log_buffering(EMAIL_AVAILABLE and is_email_enabled())
     if args.verbose:
         verbose_log("Verbose logging enabled - detailed output will be shown")
     
     log("=" * 60)
     log("SpotiM8 v6 — Sync & Yearly Archive Playlists")
     log("=" * 60)
-    log(f"Data directory: {get_sync_data_dir()}")
+    # Looked up once; steps read it from args
+    args.sync_data_dir = get_sync_data_dir()
+    log(f"Data directory: {args.sync_data_dir}")
     if _data_dir_env:
         verbose_log(f"  (from SPOTIM8_DATA_DIR / DATA_DIR env)")
     else:
@@ -239,6 +464,15 @@ Examples:
     error = None
     summary = {}
     
+    # Fail fast with every config problem at once, before auth or any step runs
+    from src.scripts.common.config_helpers import ConfigurationError, validate_config
+    try:
+        validate_config(_config.STARTUP_CONFIG_SCHEMA)
+    except ConfigurationError as e:
+        log(f"ERROR: {e}")
+        _send_email_notification(False, error=e)
+        sys.exit(1)
+    
     try:
         verbose_log("Initializing Spotify client...")
         sp = get_spotify_client()
@@ -250,7 +484,6 @@ Examples:
         log(f"ERROR: Authentication failed: {e}")
         verbose_log(f"Authentication error details: {type(e).__name__}: {str(e)}")
         if args.verbose:
-            import traceback
             verbose_log(f"Traceback:\n{traceback.format_exc()}")
         error = e
         _send_email_notification(False, error=error)
@@ -282,104 +515,12 @@ Examples:
 
         for step_id in steps_to_run:
             log("")
-            if step_id == "sync":
-                log(">>> STEP: DATA SYNC <<<")
-                with timed_step("Full Library Sync"):
-                    sync_success = sync_full_library(force=args.force)
-                    summary["sync_completed"] = "Yes" if sync_success else "No"
-                    verbose_log(f"Sync completed: success={sync_success}")
-
-            elif step_id == "rename":
-                log(">>> STEP: RENAME PLAYLISTS <<<")
-                with timed_step("Rename Playlists with Old Prefixes"):
-                    rename_playlists_with_old_prefixes(sp)
-
-            elif step_id == "delete_monthly_and_genre":
-                log(">>> STEP: CLEANUP LEGACY PLAYLISTS <<<")
-                with timed_step("Cleanup legacy automated playlists"):
-                    delete_automated_monthly_and_genre_playlists(sp)
-
-            elif step_id == "consolidate":
-                log(">>> STEP: ENSURE YEARLY ARCHIVE PLAYLISTS <<<")
-                with timed_step("Ensure yearly archive playlists"):
-                    consolidate_old_monthly_playlists(sp, keep_last_n_months=0)
-
-            elif step_id == "update_current_year":
-                log(">>> STEP: UPDATE CURRENT YEAR <<<")
-                with timed_step("Update current year Finds, Top, Discovery"):
-                    update_current_year_playlists(sp)
-
-            elif step_id == "descriptions":
-                log(">>> STEP: PLAYLIST DESCRIPTIONS <<<")
-                with timed_step("Update playlist descriptions"):
-                    try:
-                        import pandas as _pd
-                        sync_data_dir = get_sync_data_dir()
-                        playlists_path = sync_data_dir / "playlists.parquet"
-                        if not playlists_path.exists():
-                            log(f"  playlists.parquet not found at {playlists_path}; skipping description updates")
-                        else:
-                            log(f"  Using playlists from {playlists_path}")
-                            playlists_df = _pd.read_parquet(playlists_path)
-                            if "is_owned" not in playlists_df.columns:
-                                owned = playlists_df
-                            else:
-                                owned = playlists_df[playlists_df["is_owned"] == True]
-                            n_owned = len(owned)
-                            log(f"  Updating descriptions for {n_owned} owned playlist(s)...")
-                            for idx, (_, row) in enumerate(owned.iterrows()):
-                                pid = row.get("playlist_id") or row.get("id")
-                                if pid:
-                                    verbose_log(f"  Description update {idx + 1}/{n_owned}: playlist_id={pid}")
-                                    _update_playlist_description_with_genres(sp, user["id"], pid, None)
-                            log(f"  Description updates complete ({n_owned} playlists processed)")
-                    except Exception as e:
-                        log(f"  Update all descriptions failed (non-fatal): {e}")
-                        verbose_log(f"  Exception: {type(e).__name__}: {e}")
-
-            elif step_id == "health_check":
-                log(">>> STEP: HEALTH CHECK <<<")
-                with timed_step("Playlist Health Check"):
-                    try:
-                        from .playlist_organization import get_playlist_organization_report, print_organization_report
-                        import pandas as pd
-                        playlists_df = pd.read_parquet(DATA_DIR / "playlists.parquet")
-                        playlist_tracks_df = pd.read_parquet(DATA_DIR / "playlist_tracks.parquet")
-                        tracks_df = pd.read_parquet(DATA_DIR / "tracks.parquet")
-                        owned_playlists = (
-                            playlists_df[playlists_df["is_owned"] == True].copy()
-                            if "is_owned" in playlists_df.columns
-                            else playlists_df.copy()
-                        )
-                        report = get_playlist_organization_report(
-                            owned_playlists, playlist_tracks_df, tracks_df
-                        )
-                        print_organization_report(report)
-                    except Exception as e:
-                        verbose_log(f"  Health check failed (non-fatal): {e}")
-
-            elif step_id == "insights_report":
-                log(">>> STEP: INSIGHTS REPORT <<<")
-                with timed_step("Generating Insights Report"):
-                    try:
-                        from .playlist_intelligence import generate_listening_insights_report
-                        import pandas as pd
-                        playlists_df = pd.read_parquet(DATA_DIR / "playlists.parquet")
-                        playlist_tracks_df = pd.read_parquet(DATA_DIR / "playlist_tracks.parquet")
-                        tracks_df = pd.read_parquet(DATA_DIR / "tracks.parquet")
-                        streaming_history_df = None
-                        streaming_path = DATA_DIR / "streaming_history.parquet"
-                        if streaming_path.exists():
-                            streaming_history_df = pd.read_parquet(streaming_path)
-                        report = generate_listening_insights_report(
-                            playlists_df, playlist_tracks_df, tracks_df, streaming_history_df
-                        )
-                        log("\n" + report)
-                    except Exception as e:
-                        verbose_log(f"  Insights report failed (non-fatal): {e}")
-
-            else:
+            handler = STEPS.get(step_id)
+            if handler is None:
                 verbose_log(f"  Unknown step skipped: {step_id}")
+                continue
+            log(STEP_BANNERS.get(step_id, f">>> STEP: {step_id.upper()} <<<"))
+            handler(sp, user, args, summary)
 
         log("\n" + "=" * 60)
         log("✅ Complete!")
@@ -388,13 +529,14 @@ Examples:
         
     except Exception as e:
         log(f"ERROR: {e}")
-        import traceback
         error_trace = traceback.format_exc()
         log(error_trace)
         error = e
         success = False
     
     finally:
+        # Drop the in-memory handoff so a later main() in the same process re-reads from disk
+        _SYNC_STATE.clear()
         # Send email notification
         _send_email_notification(success, summary=summary, error=error)
         
@@ -429,7 +571,6 @@ def _send_email_notification(success: bool, summary: dict = None, error: Excepti
     except Exception as e:
         # Don't fail the sync if email fails
         log(f"  ⚠️  Email notification error (non-fatal): {e}")
-        import traceback
         log(traceback.format_exc())
 
 
@@ -7,10 +7,13 @@ Used to build argparse and set env overrides.
 
 from __future__ import annotations
 
+import os
+import re
 from dataclasses import dataclass
-from pathlib import Path
 from typing import TYPE_CHECKING, Any, List, Optional
 
+from src.scripts.common.config_helpers import _resolve_path_cached
+
 if TYPE_CHECKING:
     import argparse
 
@@ -18,7 +21,7 @@ if TYPE_CHECKING:
 # Option definition: (env_key, default, type, cli_flag, help_text, choices?)
 # -----------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class SyncOption:
     """One configurable option."""
     key: str                          # internal key (e.g. "owner_name")
@@ -45,6 +48,9 @@ def _opts() -> List[SyncOption]:
         SyncOption("force", None, False, "bool", "--force", False,
                    "Force full sync without cache.", section="sync",
                    label="Force full refresh"),
+        SyncOption("no_cache", None, False, "bool", "--no-cache", False,
+                   "Re-read parquet files in every step instead of reusing them within a run.", section="sync",
+                   label="Disable parquet read cache"),
         SyncOption("verbose", None, False, "bool", "--verbose", False,
                    "Enable verbose logging.", section="sync",
                    label="Verbose logging"),
@@ -124,6 +130,11 @@ def _opts() -> List[SyncOption]:
 
 SYNC_OPTIONS: List[SyncOption] = _opts()
 
+# Precomputed views so helpers don't rescan/filter SYNC_OPTIONS on every call
+_OPTS_WITH_ENV: List[SyncOption] = [o for o in SYNC_OPTIONS if o.env_key is not None]
+_OPTS_WITH_CLI: List[SyncOption] = [o for o in SYNC_OPTIONS if o.cli_flag is not None]
+_OPTS_BY_KEY = {o.key: o for o in SYNC_OPTIONS}
+
 # Ordered list of sync step IDs (for --steps). Must match step dispatch in sync.py.
 SYNC_STEP_IDS: List[str] = [
     "sync",
@@ -135,13 +146,21 @@ SYNC_STEP_IDS: List[str] = [
     "health_check",
     "insights_report",
 ]
+SYNC_STEP_IDS_SET = frozenset(SYNC_STEP_IDS)
+
+# --steps accepts commas and/or whitespace between ids
+_STEPS_SPLIT = re.compile(r"[,\s]+")
+
+
+def _split_steps(steps_str: str) -> List[str]:
+    return [s for s in _STEPS_SPLIT.split(str(steps_str).lower()) if s]
 
 
 def parse_steps(steps_str: Optional[str]) -> Optional[List[str]]:
     """Parse --steps 'a,b,c' into list of step ids in SYNC_STEP_IDS order. Invalid ids skipped. None/empty -> None (run all)."""
     if not steps_str or not str(steps_str).strip():
         return None
-    requested = [s.strip().lower() for s in str(steps_str).split(",") if s.strip()]
+    requested = set(_split_steps(steps_str))
     valid = [s for s in SYNC_STEP_IDS if s in requested]
     # If user passed --steps but all invalid, return [] (run nothing). Else return valid or None.
     return valid if valid else [] if requested else None
@@ -151,8 +170,7 @@ def requested_unknown_steps(steps_str: Optional[str]) -> List[str]:
     """Return list of requested step ids that are not in SYNC_STEP_IDS (for warnings)."""
     if not steps_str or not str(steps_str).strip():
         return []
-    requested = [s.strip().lower() for s in str(steps_str).split(",") if s.strip()]
-    return [s for s in requested if s not in SYNC_STEP_IDS]
+    return [s for s in _split_steps(steps_str) if s not in SYNC_STEP_IDS_SET]
 
 
 def options_by_section() -> dict:
@@ -163,19 +181,23 @@ def options_by_section() -> dict:
     return out
 
 
+def _resolve_path(value: str) -> str:
+    """Absolute form of a path option. resolve() touches the filesystem, so the shared
+    config_helpers cache is used; relative paths are keyed by the current directory."""
+    return str(_resolve_path_cached(value, "" if os.path.isabs(value) else os.getcwd()))
+
+
 def build_env_overrides_from_args(args: Any) -> dict:
     """Given parsed argparse namespace, return env overrides (env_key -> str value)."""
     overrides = {}
-    for o in SYNC_OPTIONS:
-        if o.env_key is None:
-            continue
+    for o in _OPTS_WITH_ENV:
         val = getattr(args, o.key, None)
         if val is None:
             continue
         if o.kind == "bool":
             overrides[o.env_key] = "true" if val else "false"
-        elif o.kind == "path" and val is not None:
-            overrides[o.env_key] = str(Path(val).resolve())
+        elif o.kind == "path" and val:
+            overrides[o.env_key] = _resolve_path(str(val))
         else:
             overrides[o.env_key] = str(val)
     return overrides
@@ -184,16 +206,14 @@ def build_env_overrides_from_args(args: Any) -> dict:
 def build_env_overrides_from_dict(values: dict) -> dict:
     """Given option key -> value dict, return env overrides for subprocess."""
     overrides = {}
-    for o in SYNC_OPTIONS:
-        if o.env_key is None:
-            continue
+    for o in _OPTS_WITH_ENV:
         val = values.get(o.key)
         if val is None or (o.kind in ("str", "path") and str(val).strip() == ""):
             continue
         if o.kind == "bool":
             overrides[o.env_key] = "true" if val else "false"
         elif o.kind == "path" and val:
-            overrides[o.env_key] = str(Path(val).resolve())
+            overrides[o.env_key] = _resolve_path(str(val))
         else:
             overrides[o.env_key] = str(val)
     return overrides
@@ -202,9 +222,7 @@ def build_env_overrides_from_dict(values: dict) -> dict:
 def build_parser_args_from_dict(values: dict) -> List[str]:
     """Build argv list from a dict of option key -> value."""
     argv = []
-    for o in SYNC_OPTIONS:
-        if o.cli_flag is None:
-            continue
+    for o in _OPTS_WITH_CLI:
         val = values.get(o.key)
         if val is None or (o.kind in ("str", "path") and str(val).strip() == ""):
             continue
@@ -222,14 +240,12 @@ def build_parser_args_from_dict(values: dict) -> List[str]:
 
 def get_defaults_dict() -> dict:
     """Return option key -> default value for UI/CLI defaults."""
-    return {o.key: o.default for o in SYNC_OPTIONS}
+    return {key: o.default for key, o in _OPTS_BY_KEY.items()}
 
 
 def add_sync_arguments(parser: "argparse.ArgumentParser") -> None:
     """Add all sync option arguments to an ArgumentParser. Requires argparse.ArgumentParser."""
-    for o in SYNC_OPTIONS:
-        if o.cli_flag is None:
-            continue
+    for o in _OPTS_WITH_CLI:
         dest = o.key
         if o.kind == "bool":
             if o.cli_negatable:
@@ -251,15 +267,4 @@ def add_sync_arguments(parser: "argparse.ArgumentParser") -> None:
 def apply_env_overrides_from_args(args: Any) -> None:
     """Set os.environ from parsed args for every option that has env_key."""
     import os
-    for o in SYNC_OPTIONS:
-        if o.env_key is None:
-            continue
-        val = getattr(args, o.key, None)
-        if val is None:
-            continue
-        if o.kind == "bool":
-            os.environ[o.env_key] = "true" if val else "false"
-        elif o.kind == "path" and val:
-            os.environ[o.env_key] = str(Path(val).resolve())
-        else:
-            os.environ[o.env_key] = str(val)
+    os.environ.update(build_env_overrides_from_args(args))
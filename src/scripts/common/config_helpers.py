@@ -8,81 +8,162 @@ Provides consistent utilities for:
 - Type-safe configuration access
 """
 
+import keyword
 import os
-from typing import Optional, Any, Union
+import re
+from dataclasses import make_dataclass
+from functools import lru_cache
+from typing import Mapping, Optional, Any, Union
 from pathlib import Path
 
+class ConfigurationError(ValueError):
+    """Raised by validate_config with every failing entry of the schema."""
+    
+    def __init__(self, errors: list[tuple[str, str]]):
+        self.errors = errors
+        lines = "\n".join(f"  {key}: {msg}" for key, msg in errors)
+        super().__init__(f"Invalid configuration ({len(errors)} error(s)):\n{lines}")
+
+
+# Strings parse_bool_env treats as true (after strip); common casings listed so no lower() is needed
+_TRUE_TOKENS = frozenset((
+    "true", "True", "TRUE", "1",
+    "yes", "Yes", "YES",
+    "on", "On", "ON",
+))
+# Strings validate_config accepts as false for a bool entry (parse_bool_env treats anything else as false)
+_FALSE_TOKENS = frozenset((
+    "", "false", "False", "FALSE", "0",
+    "no", "No", "NO",
+    "off", "Off", "OFF",
+))
+
+# Parsed values keyed by (kind, key, default, raw env value). The raw value is part of the
+# key, so overrides applied to os.environ at runtime (--config, reload_from_env) are still seen.
+_env_cache: dict = {}
+
+
+def _fast_strip(value: str) -> str:
+    """str.strip() that returns value itself (no new string) when there is nothing to strip."""
+    if value and not value[0].isspace() and not value[-1].isspace():
+        return value
+    return value.strip()
+
+
+# Separator plus surrounding whitespace, so split and strip happen in one regex pass
+_COMMA_SPLIT = re.compile(r"\s*,\s*")
+
+
+@lru_cache(maxsize=16)
+def _separator_pattern(separator: str) -> "re.Pattern[str]":
+    """Compiled split pattern for a non-comma parse_list_env separator."""
+    return re.compile(rf"\s*{re.escape(separator)}\s*")
 
-def parse_bool_env(key: str, default: bool = False) -> bool:
+
+def snapshot_env() -> dict[str, str]:
+    """Copy os.environ once, for startup code that reads many variables via env=."""
+    return dict(os.environ)
+
+
+def invalidate_env_cache() -> None:
+    """Drop all memoized parse_*_env results (and resolved validate_path_env paths)."""
+    _env_cache.clear()
+    _resolve_path_cached.cache_clear()
+
+
+def parse_bool_env(key: str, default: bool = False, env: Mapping[str, str] = os.environ) -> bool:
     """
     Parse boolean environment variable.
     
     Args:
         key: Environment variable name
         default: Default value if not set
+        env: Mapping to read from (default: os.environ; see snapshot_env)
     
     Returns:
         Boolean value parsed from environment
     """
-    value = os.environ.get(key, str(default)).lower().strip()
-    return value in ("true", "1", "yes", "on")
+    # A strip and a set lookup are cheaper than building an _env_cache key
+    value = env.get(key)
+    if value is None:
+        return default
+    return _fast_strip(value) in _TRUE_TOKENS
 
 
-def parse_int_env(key: str, default: int = 0) -> int:
+def parse_int_env(key: str, default: int = 0, env: Mapping[str, str] = os.environ) -> int:
     """
     Parse integer environment variable.
     
     Args:
         key: Environment variable name
         default: Default value if not set
+        env: Mapping to read from (default: os.environ; see snapshot_env)
     
     Returns:
         Integer value parsed from environment
     """
-    value = os.environ.get(key)
+    value = env.get(key)
     if value is None:
         return default
+    cache_key = ("int", key, default, value)
+    try:
+        return _env_cache[cache_key]
+    except KeyError:
+        pass
     try:
-        return int(value)
+        result = int(value)
     except (ValueError, TypeError):
-        return default
+        result = default
+    _env_cache[cache_key] = result
+    return result
 
 
-def parse_float_env(key: str, default: float = 0.0) -> float:
+def parse_float_env(key: str, default: float = 0.0, env: Mapping[str, str] = os.environ) -> float:
     """
     Parse float environment variable.
     
     Args:
         key: Environment variable name
         default: Default value if not set
+        env: Mapping to read from (default: os.environ; see snapshot_env)
     
     Returns:
         Float value parsed from environment
     """
-    value = os.environ.get(key)
+    value = env.get(key)
     if value is None:
         return default
+    cache_key = ("float", key, default, value)
     try:
-        return float(value)
+        return _env_cache[cache_key]
+    except KeyError:
+        pass
+    try:
+        result = float(value)
     except (ValueError, TypeError):
-        return default
+        result = default
+    _env_cache[cache_key] = result
+    return result
 
 
-def parse_str_env(key: str, default: str = "") -> str:
+def parse_str_env(key: str, default: str = "", env: Mapping[str, str] = os.environ) -> str:
     """
     Parse string environment variable.
     
     Args:
         key: Environment variable name
         default: Default value if not set
+        env: Mapping to read from (default: os.environ; see snapshot_env)
     
     Returns:
         String value from environment, or default
     """
-    return os.environ.get(key, default).strip()
+    return _fast_strip(env.get(key, default))
 
 
-def parse_list_env(key: str, default: Optional[list] = None, separator: str = ",") -> list:
+def parse_list_env(
+    key: str, default: Optional[list] = None, separator: str = ",", env: Mapping[str, str] = os.environ
+) -> list:
     """
     Parse list from environment variable (comma-separated).
     
@@ -90,39 +171,48 @@ def parse_list_env(key: str, default: Optional[list] = None, separator: str = ",
         key: Environment variable name
         default: Default value if not set
         separator: Separator character (default: comma)
+        env: Mapping to read from (default: os.environ; see snapshot_env)
     
     Returns:
         List of strings parsed from environment
     """
     if default is None:
         default = []
-    value = os.environ.get(key)
-    if value is None or not value.strip():
+    value = env.get(key)
+    if value is None or not _fast_strip(value):
         return default
-    return [item.strip() for item in value.split(separator) if item.strip()]
+    cache_key = ("list", key, separator, value)
+    items = _env_cache.get(cache_key)
+    if items is None:
+        pattern = _COMMA_SPLIT if separator == "," else _separator_pattern(separator)
+        items = _env_cache[cache_key] = tuple(item for item in pattern.split(_fast_strip(value)) if item)
+    # Fresh list per call so callers can mutate it without touching the cache
+    return list(items)
 
 
-def get_env_or_none(key: str) -> Optional[str]:
+def get_env_or_none(key: str, env: Mapping[str, str] = os.environ) -> Optional[str]:
     """
     Get environment variable or None if not set.
     
     Args:
         key: Environment variable name
+        env: Mapping to read from (default: os.environ; see snapshot_env)
     
     Returns:
         Value or None if not set
     """
-    value = os.environ.get(key)
-    return value.strip() if value else None
+    value = env.get(key)
+    return _fast_strip(value) if value else None
 
 
-def require_env(key: str, error_message: Optional[str] = None) -> str:
+def require_env(key: str, error_message: Optional[str] = None, env: Mapping[str, str] = os.environ) -> str:
     """
     Require environment variable to be set.
     
     Args:
         key: Environment variable name
         error_message: Custom error message (default: includes key name)
+        env: Mapping to read from (default: os.environ; see snapshot_env)
     
     Returns:
         Value of environment variable
@@ -130,15 +220,18 @@ def require_env(key: str, error_message: Optional[str] = None) -> str:
     Raises:
         ValueError: If environment variable is not set
     """
-    value = os.environ.get(key)
-    if not value or not value.strip():
+    value = env.get(key)
+    value = _fast_strip(value) if value else value
+    if not value:
         if error_message:
             raise ValueError(error_message)
         raise ValueError(f"Required environment variable '{key}' is not set")
-    return value.strip()
+    return value
 
 
-def validate_path_env(key: str, must_exist: bool = False, must_be_dir: bool = False) -> Optional[Path]:
+def validate_path_env(
+    key: str, must_exist: bool = False, must_be_dir: bool = False, env: Mapping[str, str] = os.environ
+) -> Optional[Path]:
     """
     Validate path from environment variable.
     
@@ -146,6 +239,7 @@ def validate_path_env(key: str, must_exist: bool = False, must_be_dir: bool = Fa
         key: Environment variable name
         must_exist: Whether path must exist
         must_be_dir: Whether path must be a directory
+        env: Mapping to read from (default: os.environ; see snapshot_env)
     
     Returns:
         Path object or None if not set
@@ -153,12 +247,15 @@ def validate_path_env(key: str, must_exist: bool = False, must_be_dir: bool = Fa
     Raises:
         ValueError: If validation fails
     """
-    value = os.environ.get(key)
+    value = env.get(key)
     if not value:
         return None
     
-    path = Path(value).expanduser().resolve()
+    expanded = os.path.expanduser(value)
+    # Relative paths resolve against the current directory, so it is part of the cache key
+    path = _resolve_path_cached(expanded, "" if os.path.isabs(expanded) else os.getcwd())
     
+    # Existence checks run on every call: the filesystem may have changed since resolving
     if must_exist and not path.exists():
         raise ValueError(f"Path from {key} does not exist: {path}")
     
@@ -166,3 +263,94 @@ def validate_path_env(key: str, must_exist: bool = False, must_be_dir: bool = Fa
         raise ValueError(f"Path from {key} is not a directory: {path}")
     
     return path
+
+
+@lru_cache(maxsize=64)
+def _resolve_path_cached(expanded: str, cwd: str) -> Path:
+    """Path(expanded).resolve(), memoized per (path, cwd for relative paths); cleared by invalidate_env_cache()."""
+    return Path(expanded).resolve()
+
+
+# Schema "type" -> parser; Python types are accepted as aliases of the names
+_CONFIG_PARSERS = {
+    "bool": parse_bool_env,
+    "int": parse_int_env,
+    "float": parse_float_env,
+    "str": parse_str_env,
+    "list": parse_list_env,
+    "path": validate_path_env,
+}
+_CONFIG_TYPE_NAMES = {bool: "bool", int: "int", float: "float", str: "str", list: "list", Path: "path"}
+
+
+def validate_config(schema: dict[str, dict[str, Any]], env: Mapping[str, str] = os.environ) -> Any:
+    """
+    Validate a set of environment variables up front.
+    
+    Each schema entry maps an env var name to a spec with keys ``type`` (bool, int,
+    float, str, list or path; default str), ``required``, ``default``, ``separator``
+    (list) and ``must_exist`` / ``must_be_dir`` (path), e.g.::
+    
+        validate_config({
+            "SPOTIPY_CLIENT_ID": {"type": str, "required": True},
+            "CACHE_DIR": {"type": "path", "must_be_dir": True},
+        })
+    
+    Args:
+        schema: Mapping of env var name -> spec
+        env: Mapping to read from (default: os.environ; see snapshot_env)
+    
+    Returns:
+        Frozen dataclass instance with one attribute per schema key
+    
+    Raises:
+        ConfigurationError: Listing every entry that is missing or invalid
+    """
+    errors: list[tuple[str, str]] = []
+    values: dict[str, Any] = {}
+    
+    for key, spec in schema.items():
+        # Keys become attributes of the returned dataclass
+        if not key.isidentifier() or keyword.iskeyword(key):
+            errors.append((key, "not a valid identifier (cannot be a config attribute)"))
+            continue
+        kind = spec.get("type", "str")
+        kind = _CONFIG_TYPE_NAMES.get(kind, kind)
+        parser = _CONFIG_PARSERS.get(kind)
+        if parser is None:
+            errors.append((key, f"unknown type {kind!r}"))
+            continue
+        
+        raw = env.get(key)
+        if spec.get("required") and (raw is None or not _fast_strip(raw)):
+            errors.append((key, "required but not set"))
+            continue
+        
+        try:
+            if kind == "path":
+                value = parser(key, spec.get("must_exist", False), spec.get("must_be_dir", False), env=env)
+            elif kind == "list":
+                value = parser(key, spec.get("default"), spec.get("separator", ","), env=env)
+            else:
+                # parse_int_env / parse_float_env fall back to the default on bad input;
+                # here a malformed value is an error
+                if kind in ("int", "float") and raw is not None:
+                    try:
+                        (int if kind == "int" else float)(raw)
+                    except ValueError:
+                        raise ValueError(f"expected {kind}, got {raw!r}") from None
+                if kind == "bool" and raw is not None:
+                    token = _fast_strip(raw)
+                    if token not in _TRUE_TOKENS and token not in _FALSE_TOKENS:
+                        raise ValueError(f"expected a boolean (true/false, yes/no, on/off, 1/0), got {raw!r}")
+                value = parser(key, spec["default"], env=env) if "default" in spec else parser(key, env=env)
+        except ValueError as e:
+            errors.append((key, str(e)))
+            continue
+        values[key] = value
+    
+    if errors:
+        raise ConfigurationError(errors)
+    
+    config_cls = make_dataclass("ValidatedConfig", list(values), frozen=True)
+    return config_cls(**values)
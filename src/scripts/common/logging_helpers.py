@@ -6,14 +6,102 @@ All modules should use these helpers instead of print() or direct logging.
 """
 
 import logging
+import logging.handlers
 import sys
-from typing import Optional
-from datetime import datetime
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Mapping, Optional
 from pathlib import Path
 
+from .config_helpers import parse_int_env
+
 # Global logger instance
 _logger: Optional[logging.Logger] = None
-_log_buffer: list[str] = []
+# Serializes first-time setup so concurrent callers don't attach duplicate handlers
+_setup_lock = threading.Lock()
+
+class _RecentRecordsHandler(logging.handlers.BufferingHandler):
+    """Keeps (created, levelname, message) of the most recent records (oldest dropped first).
+    
+    Lines are only formatted when read via format_entries(), and LogRecords (with their
+    args/exc_info references) are not retained.
+    """
+    
+    def __init__(self, capacity: int):
+        super().__init__(capacity)
+        self.buffer = deque(maxlen=capacity)
+    
+    def shouldFlush(self, record: logging.LogRecord) -> bool:
+        # The deque bounds itself; flush() is only used to clear
+        return False
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            message = record.getMessage()
+            if record.exc_info:
+                message = f"{message}\n{logging.Formatter().formatException(record.exc_info)}"
+            self.buffer.append((record.created, record.levelname, message))
+        except Exception:
+            self.handleError(record)
+    
+    def format_entries(self) -> list[str]:
+        """Buffered entries as '[YYYY-MM-DD HH:MM:SS] LEVEL: message' lines."""
+        with self.lock:
+            entries = list(self.buffer)
+        return [f"[{_ts(created)}] {level}: {message}" for created, level, message in entries]
+
+
+# Single source of truth for get_log_buffer(), for callers that collect run output
+_buffer_handler = _RecentRecordsHandler(max(1, parse_int_env("LOG_BUFFER_SIZE", 10000)))
+
+
+class _OneWriteStream(logging.StreamHandler):
+    """StreamHandler that writes message and terminator in a single call."""
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            self.flush()
+        except Exception:
+            self.handleError(record)
+
+# Level name -> logging level (log() accepts names in any case)
+_LEVELS = {name: getattr(logging, name) for name in ("DEBUG", "INFO", "WARNING", "WARN", "ERROR", "CRITICAL", "FATAL")}
+
+
+@dataclass(frozen=True, slots=True)
+class LoggingCtx:
+    """Logger, record buffer and level table used by the module-level helpers."""
+    logger: logging.Logger
+    buffer: _RecentRecordsHandler
+    levels: Mapping[str, int]
+
+
+# Process-wide context, published by setup_unified_logging
+_default_ctx: Optional[LoggingCtx] = None
+
+# (epoch second, formatted timestamp) of the last _ts() call; rebound as a whole so
+# concurrent readers never see a mismatched pair
+_ts_cache: tuple[int, str] = (-1, "")
+
+
+def _ts(created: float) -> str:
+    """Format a timestamp as YYYY-MM-DD HH:MM:SS, reusing the string within the same second."""
+    global _ts_cache
+    sec = int(created)
+    cached = _ts_cache
+    if cached[0] != sec:
+        cached = _ts_cache = (sec, time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(sec)))
+    return cached[1]
+
+
+class _Formatter(logging.Formatter):
+    """Formatter whose %(asctime)s comes from the per-second _ts() cache."""
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        return _ts(record.created)
 
 
 def setup_unified_logging(log_dir: Optional[Path] = None, verbose: bool = False) -> logging.Logger:
@@ -27,41 +115,53 @@ def setup_unified_logging(log_dir: Optional[Path] = None, verbose: bool = False)
     Returns:
         Configured logger instance
     """
-    global _logger
+    global _logger, _default_ctx
     
+    # Lock-free fast path once setup has completed
     if _logger is not None:
         return _logger
-    
+    with _setup_lock:
+        if _logger is not None:
+            return _logger
+        logger = _setup_unified_logging_locked(log_dir, verbose)
+        # Context first: anyone who sees _logger set can rely on _default_ctx
+        _default_ctx = LoggingCtx(logger, _buffer_handler, _LEVELS)
+        _logger = logger
+        return logger
+
+
+def _setup_unified_logging_locked(log_dir: Optional[Path], verbose: bool) -> logging.Logger:
+    """Body of setup_unified_logging; caller holds _setup_lock and publishes the result."""
     logger = logging.getLogger("spotim8")
     logger.setLevel(logging.DEBUG if verbose else logging.INFO)
     
     # Avoid duplicate handlers
     if logger.handlers:
-        _logger = logger
+        if _buffer_handler not in logger.handlers:
+            logger.addHandler(_buffer_handler)
         return logger
     
     # Console handler with formatted output
-    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler = _OneWriteStream(sys.stdout)
     console_handler.setLevel(logging.DEBUG if verbose else logging.INFO)
     
     # Format: [YYYY-MM-DD HH:MM:SS] LEVEL message
-    formatter = logging.Formatter(
-        '[%(asctime)s] %(levelname)s: %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
+    formatter = _Formatter('[%(asctime)s] %(levelname)s: %(message)s')
     console_handler.setFormatter(formatter)
     logger.addHandler(console_handler)
     
+    # Buffer handler: stores raw entries, formatted only if get_log_buffer() is called
+    logger.addHandler(_buffer_handler)
+    
     # File handler if log_dir provided
     if log_dir:
         log_dir.mkdir(parents=True, exist_ok=True)
-        log_file = log_dir / f"sync_{datetime.now().strftime('%Y%m%d')}.log"
+        log_file = log_dir / f"sync_{time.strftime('%Y%m%d')}.log"
         file_handler = logging.FileHandler(log_file, encoding='utf-8')
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(formatter)
         logger.addHandler(file_handler)
     
-    _logger = logger
     return logger
 
 
@@ -73,6 +173,13 @@ def get_logger() -> logging.Logger:
     return _logger
 
 
+def get_logging_ctx() -> LoggingCtx:
+    """Get the process-wide logging context, setting up logging if needed."""
+    if _default_ctx is None:
+        setup_unified_logging()
+    return _default_ctx
+
+
 def log(msg: str, level: str = "INFO") -> None:
     """
     Log a message with consistent formatting.
@@ -81,40 +188,42 @@ def log(msg: str, level: str = "INFO") -> None:
         msg: Message to log
         level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
     """
-    logger = get_logger()
-    log_level = getattr(logging, level.upper(), logging.INFO)
+    ctx = _default_ctx or get_logging_ctx()
+    logger = ctx.logger
+    log_level = ctx.levels.get(level) or ctx.levels.get(level.upper(), logging.INFO)
+    if not logger.isEnabledFor(log_level):
+        return
+    # The buffer is filled by _buffer_handler, so DEBUG lines are kept only when verbose
     logger.log(log_level, msg)
-    
-    # Also add to buffer for compatibility
-    _log_buffer.append(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] {level}: {msg}")
 
 
 def verbose_log(msg: str) -> None:
     """Log a verbose/debug message."""
-    log(msg, level="DEBUG")
+    (_default_ctx or get_logging_ctx()).logger.debug(msg)
 
 
 def info(msg: str) -> None:
     """Log an info message."""
-    log(msg, level="INFO")
+    (_default_ctx or get_logging_ctx()).logger.info(msg)
 
 
 def warning(msg: str) -> None:
     """Log a warning message."""
-    log(msg, level="WARNING")
+    (_default_ctx or get_logging_ctx()).logger.warning(msg)
 
 
 def error(msg: str) -> None:
     """Log an error message."""
-    log(msg, level="ERROR")
+    (_default_ctx or get_logging_ctx()).logger.error(msg)
 
 
 def get_log_buffer() -> list[str]:
     """Get the log buffer (for compatibility with existing code)."""
-    return _log_buffer.copy()
+    ctx = _default_ctx
+    return (ctx.buffer if ctx is not None else _buffer_handler).format_entries()
 
 
 def clear_log_buffer() -> None:
     """Clear the log buffer."""
-    global _log_buffer
-    _log_buffer = []
+    ctx = _default_ctx
+    (ctx.buffer if ctx is not None else _buffer_handler).flush()
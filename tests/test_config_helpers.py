@@ -0,0 +1,94 @@
+"""Tests for config_helpers validation helpers."""
+
+import dataclasses
+
+import pytest
+
+from src.scripts.common.config_helpers import ConfigurationError, validate_config, validate_path_env
+
+
+def test_validate_config_parses_values(tmp_path):
+    """Each schema type is parsed and exposed as a frozen attribute."""
+    env = {
+        "CLIENT_ID": " abc ",
+        "WORKERS": "4",
+        "RATIO": "0.5",
+        "ENABLED": "yes",
+        "TAGS": "a, b,,c",
+        "CACHE_DIR": str(tmp_path),
+    }
+    config = validate_config({
+        "CLIENT_ID": {"type": str, "required": True},
+        "WORKERS": {"type": int},
+        "RATIO": {"type": "float"},
+        "ENABLED": {"type": bool},
+        "TAGS": {"type": list},
+        "CACHE_DIR": {"type": "path", "must_be_dir": True},
+        "MISSING": {"type": int, "default": 7},
+    }, env=env)
+    assert config.CLIENT_ID == "abc"
+    assert config.WORKERS == 4
+    assert config.RATIO == 0.5
+    assert config.ENABLED is True
+    assert config.TAGS == ["a", "b", "c"]
+    assert config.CACHE_DIR == tmp_path.resolve()
+    assert config.MISSING == 7
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.WORKERS = 8
+
+
+def test_validate_config_collects_all_errors(tmp_path):
+    """Every failing entry is reported in a single ConfigurationError."""
+    env = {"WORKERS": "four", "CACHE_DIR": str(tmp_path / "nope")}
+    with pytest.raises(ConfigurationError) as excinfo:
+        validate_config({
+            "CLIENT_ID": {"required": True},
+            "WORKERS": {"type": int},
+            "CACHE_DIR": {"type": "path", "must_exist": True},
+            "MY-VAR": {},
+            "class": {},
+            "ODD": {"type": "uuid"},
+        }, env=env)
+    failed = [key for key, _ in excinfo.value.errors]
+    assert failed == ["CLIENT_ID", "WORKERS", "CACHE_DIR", "MY-VAR", "class", "ODD"]
+    assert isinstance(excinfo.value, ValueError)
+
+
+def test_validate_path_env_rechecks_existence(tmp_path):
+    """Resolved paths are cached, but must_exist is checked on every call."""
+    target = tmp_path / "data"
+    target.mkdir()
+    env = {"DATA": str(target)}
+    assert validate_path_env("DATA", must_exist=True, must_be_dir=True, env=env) == target.resolve()
+    target.rmdir()
+    with pytest.raises(ValueError):
+        validate_path_env("DATA", must_exist=True, env=env)
+
+
+def test_validate_path_env_relative_follows_cwd(tmp_path, monkeypatch):
+    """A relative path resolves against the current directory at call time."""
+    env = {"DATA": "data"}
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+    monkeypatch.chdir(tmp_path / "a")
+    assert validate_path_env("DATA", env=env) == (tmp_path / "a" / "data").resolve()
+    monkeypatch.chdir(tmp_path / "b")
+    assert validate_path_env("DATA", env=env) == (tmp_path / "b" / "data").resolve()
+
+
+def test_validate_config_rejects_unknown_bool():
+    """A bool entry must be a recognised true/false token."""
+    with pytest.raises(ConfigurationError) as excinfo:
+        validate_config({"FLAG": {"type": bool}}, env={"FLAG": "maybe"})
+    assert [key for key, _ in excinfo.value.errors] == ["FLAG"]
+    assert validate_config({"FLAG": {"type": bool}}, env={"FLAG": " off "}).FLAG is False
+
+
+def test_startup_schema_reports_every_problem():
+    """The sync startup schema collects all missing/malformed variables in one error."""
+    from src.scripts.automation.config import STARTUP_CONFIG_SCHEMA
+    env = {"KEEP_MONTHLY_MONTHS": "three", "ENABLE_MOOD_TAGS": "sometimes"}
+    with pytest.raises(ConfigurationError) as excinfo:
+        validate_config(STARTUP_CONFIG_SCHEMA, env=env)
+    failed = {key for key, _ in excinfo.value.errors}
+    assert failed == {"SPOTIPY_CLIENT_ID", "SPOTIPY_CLIENT_SECRET", "KEEP_MONTHLY_MONTHS", "ENABLE_MOOD_TAGS"}
@@ -0,0 +1,45 @@
+"""Tests for streaming history track selection."""
+
+import pandas as pd
+import pytest
+
+from src.scripts.automation._sync_impl.history import (
+    get_discovery_tracks,
+    get_most_played_tracks,
+    get_top_and_discovery_tracks,
+)
+
+
+def _history():
+    plays = [
+        ("2023-01-05 08:00", "spotify:track:a", 100),
+        ("2023-01-10 09:00", "spotify:track:b", 100),
+        ("2023-02-01 10:00", "spotify:track:a", 100),
+        ("2023-02-02 11:00", "spotify:track:c", 200),
+        ("2023-02-03 12:00", "spotify:track:a", 100),
+        ("2023-02-04 13:00", "spotify:track:d", 70),
+        ("2023-02-05 14:00", "spotify:track:c", 200),
+        ("2023-02-06 15:00", "spotify:track:b", 50),
+        ("2023-02-07 16:00", "spotify:track:a", 100),
+    ]
+    return pd.DataFrame({
+        "timestamp": pd.to_datetime([p[0] for p in plays], utc=True),
+        "track_uri": [p[1] for p in plays],
+        "ms_played": [p[2] for p in plays],
+    })
+
+
+@pytest.mark.parametrize("month_str", [None, "2023-01", "2023-02", "2023-03"])
+def test_top_and_discovery_matches_separate_helpers(month_str):
+    """The single-groupby helper returns what the two separate helpers return."""
+    history = _history()
+    top, discovery = get_top_and_discovery_tracks(history, month_str=month_str, limit=100)
+    assert top == get_most_played_tracks(history, month_str=month_str, limit=100)
+    assert discovery == get_discovery_tracks(history, month_str=month_str, limit=100)
+
+
+def test_top_and_discovery_respects_limit():
+    """Both lists are cut to the limit."""
+    top, discovery = get_top_and_discovery_tracks(_history(), month_str="2023-02", limit=1)
+    assert top == ["spotify:track:a"]
+    assert discovery == ["spotify:track:c"]
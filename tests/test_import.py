@@ -34,14 +34,12 @@ def test_import_features():
         popularity_tier_features,
         build_all_features,
     )
-    assert all([
-        playlist_profile_features,
-        artist_concentration_features,
-        time_features,
-        release_year_features,
-        popularity_tier_features,
-        build_all_features,
-    ])
+    assert callable(playlist_profile_features)
+    assert callable(artist_concentration_features)
+    assert callable(time_features)
+    assert callable(release_year_features)
+    assert callable(popularity_tier_features)
+    assert callable(build_all_features)
 
 
 def test_import_ratelimit():
@@ -0,0 +1,54 @@
+"""Tests for consolidating old monthly playlists into yearly playlists."""
+
+from datetime import datetime
+from unittest.mock import MagicMock
+
+from src.scripts.automation import data_protection, sync
+from src.scripts.automation.formatting import format_yearly_playlist_name
+from src.scripts.automation.playlist_consolidation import consolidate_old_monthly_playlists
+
+
+def test_consolidate_old_monthly_playlists(monkeypatch, tmp_path):
+    """Old monthly playlists are merged into a new yearly playlist and deleted; recent ones stay."""
+    jan = f"{sync.OWNER_NAME}{sync.PREFIX_MONTHLY}Jan23"
+    feb = f"{sync.OWNER_NAME}{sync.PREFIX_MONTHLY}Feb23"
+    current = f"{sync.OWNER_NAME}{sync.PREFIX_MONTHLY}{datetime.now().strftime('%b%y')}"
+    existing = {jan: "jan-id", feb: "feb-id", current: "current-id"}
+    tracks = {
+        "jan-id": frozenset({"spotify:track:a", "spotify:track:b"}),
+        "feb-id": frozenset({"spotify:track:b", "spotify:track:c"}),
+        "current-id": frozenset({"spotify:track:d"}),
+        "yearly-id": frozenset(),
+    }
+
+    sp = MagicMock()
+    sp.user_playlist_create.return_value = {"id": "yearly-id"}
+
+    def add_items(pid, uris):
+        tracks[pid] = tracks[pid] | set(uris)
+
+    sp.playlist_add_items.side_effect = add_items
+
+    deleted = []
+
+    def safe_delete(sp, playlist_id, playlist_name, **kwargs):
+        deleted.append(playlist_name)
+        return True, None
+
+    monkeypatch.setattr(sync, "DATA_DIR", tmp_path)
+    monkeypatch.setattr(sync, "ENABLE_MONTHLY", True)
+    monkeypatch.setattr(sync, "log", lambda *args, **kwargs: None)
+    monkeypatch.setattr(sync, "get_existing_playlists", lambda sp: existing)
+    monkeypatch.setattr(sync, "get_user_info", lambda sp: {"id": "me"})
+    monkeypatch.setattr(sync, "get_playlist_tracks", lambda sp, pid, force_refresh=False: tracks[pid])
+    monkeypatch.setattr(sync, "api_call", lambda fn, *args, **kwargs: fn(*args, **kwargs))
+    monkeypatch.setattr(sync, "_update_playlist_description_with_genres", lambda *args: None)
+    monkeypatch.setattr(sync, "_invalidate_playlist_cache", lambda: None)
+    monkeypatch.setattr(data_protection, "safe_delete_playlist", safe_delete)
+
+    consolidate_old_monthly_playlists(sp, keep_last_n_months=3)
+
+    sp.user_playlist_create.assert_called_once()
+    assert sp.user_playlist_create.call_args.args[:2] == ("me", format_yearly_playlist_name("2023"))
+    assert tracks["yearly-id"] == {"spotify:track:a", "spotify:track:b", "spotify:track:c"}
+    assert sorted(deleted) == sorted([jan, feb])
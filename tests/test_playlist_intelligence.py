@@ -0,0 +1,99 @@
+"""Tests for playlist similarity detection."""
+
+import random
+import sys
+
+import pandas as pd
+import pytest
+
+from src.scripts.automation import playlist_intelligence
+from src.scripts.automation.playlist_intelligence import _jaccard_pairs, find_similar_playlists
+
+
+def _frames():
+    playlists = pd.DataFrame({
+        "playlist_id": ["p1", "p2", "p3"],
+        "name": ["One", "Two", "Three"],
+    })
+    playlist_tracks = pd.DataFrame({
+        "playlist_id": ["p1", "p1", "p1", "p2", "p2", "p2", "p3"],
+        "track_id": ["a", "b", "c", "a", "b", "d", "z"],
+    })
+    return playlists, playlist_tracks
+
+
+def test_find_similar_playlists():
+    """Overlapping playlists are reported with their Jaccard score."""
+    playlists, playlist_tracks = _frames()
+    similar = find_similar_playlists(playlists, playlist_tracks, threshold=0.3)
+    assert similar == [("One", "Two", 0.5)]
+
+
+def test_find_similar_playlists_none_above_threshold():
+    """No pair is returned when nothing reaches the threshold."""
+    playlists, playlist_tracks = _frames()
+    assert find_similar_playlists(playlists, playlist_tracks, threshold=0.9) == []
+
+
+def _random_library(n_playlists=60, n_tracks=40, seed=7):
+    rng = random.Random(seed)
+    return {
+        f"p{i}": frozenset(f"t{rng.randrange(n_tracks)}" for _ in range(rng.randrange(0, 15)))
+        for i in range(n_playlists)
+    }
+
+
+def _brute_force_pairs(playlist_tracks, threshold):
+    ids = list(playlist_tracks)
+    pairs = set()
+    for i, pid1 in enumerate(ids):
+        for pid2 in ids[i+1:]:
+            a, b = playlist_tracks[pid1], playlist_tracks[pid2]
+            union = len(a | b)
+            similarity = len(a & b) / union if union else 0.0
+            if similarity >= threshold:
+                pairs.add((pid1, pid2, round(similarity, 9)))
+    return pairs
+
+
+@pytest.mark.parametrize("path", ["sparse", "sets"])
+@pytest.mark.parametrize("threshold", [0.0, 0.2, 0.5])
+def test_jaccard_pairs_matches_brute_force(path, threshold, monkeypatch):
+    """Each exact strategy returns the same pairs as a brute-force Jaccard."""
+    if path == "sparse":
+        pytest.importorskip("scipy")
+    else:
+        # Make `from scipy import sparse` fail so the set loop runs
+        monkeypatch.setitem(sys.modules, "scipy", None)
+    playlist_tracks = _random_library()
+    pairs = {
+        (pid1, pid2, round(similarity, 9))
+        for pid1, pid2, similarity in _jaccard_pairs(playlist_tracks, threshold)
+    }
+    assert pairs == _brute_force_pairs(playlist_tracks, threshold)
+
+
+def test_jaccard_pairs_approximate_is_subset(monkeypatch):
+    """MinHash LSH (opt-in) only returns pairs that really reach the threshold."""
+    pytest.importorskip("datasketch")
+    monkeypatch.setattr(playlist_intelligence, "LSH_MIN_PLAYLISTS", 10)
+    playlist_tracks = _random_library()
+    pairs = {
+        (pid1, pid2, round(similarity, 9))
+        for pid1, pid2, similarity in _jaccard_pairs(playlist_tracks, 0.3, approximate=True)
+    }
+    assert pairs <= _brute_force_pairs(playlist_tracks, 0.3)
+
+
+def test_analyze_listening_patterns_leaves_input_untouched():
+    """String timestamps are parsed without adding columns to the caller's frame."""
+    now = pd.Timestamp.now()
+    history = pd.DataFrame({
+        "timestamp": [(now - pd.Timedelta(days=d)).isoformat() for d in (1, 2, 60)],
+        "track_name": ["a", "b", "c"],
+        "ms_played": [1000, 2000, 3000],
+    })
+    before = history.copy()
+    insights = playlist_intelligence.analyze_listening_patterns(history, days=30)
+    assert insights["top_tracks"] == {"a": 1, "b": 1}
+    pd.testing.assert_frame_equal(history, before)